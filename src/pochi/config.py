@@ -7,6 +7,7 @@ kept for backward compatibility with existing code.
 
 from __future__ import annotations
 
+import copy
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
@@ -16,6 +17,7 @@ import tomlkit
 from .config_store import (
     WORKSPACE_CONFIG_DIR,
     WORKSPACE_CONFIG_FILE,
+    get_config_path,
 )
 from .logging import get_logger
 from .settings import (
@@ -58,7 +60,7 @@ class PluginsConfig:
     auto_install: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class RalphConfig:
     """Ralph Wiggum loop configuration."""
 
@@ -66,7 +68,7 @@ class RalphConfig:
     default_max_iterations: int = 3
 
 
-@dataclass
+@dataclass(slots=True)
 class FolderConfig:
     """Configuration for a folder in the workspace (repo or plain directory)."""
 
@@ -96,7 +98,7 @@ class TelegramConfig:
     chat_id: int
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkspaceConfig:
     """Configuration for a workspace with multiple folders."""
 
@@ -250,9 +252,21 @@ def _settings_to_config(settings: WorkspaceSettings, root: Path) -> WorkspaceCon
     )
 
 
+# Parsed configs keyed by config path, invalidated by (st_mtime_ns, st_size)
+_PARSE_CACHE: dict[Path, tuple[tuple[int, int], WorkspaceConfig]] = {}
+
+
+def clear_config_cache() -> None:
+    """Clear the parsed workspace config cache (for testing)."""
+    _PARSE_CACHE.clear()
+
+
 def load_workspace_config(workspace_root: Path | None = None) -> WorkspaceConfig | None:
     """Load workspace configuration from .pochi/workspace.toml.
 
+    Parsed configs are cached per file and reused until the file's mtime or
+    size changes. Callers always receive their own copy.
+
     Args:
         workspace_root: Path to workspace root. If None, will search for it.
 
@@ -264,11 +278,24 @@ def load_workspace_config(workspace_root: Path | None = None) -> WorkspaceConfig
         if workspace_root is None:
             return None
 
+    config_path = get_config_path(workspace_root)
+    try:
+        stat = config_path.stat()
+    except OSError:
+        return None
+    stamp = (stat.st_mtime_ns, stat.st_size)
+
+    cached = _PARSE_CACHE.get(config_path)
+    if cached is not None and cached[0] == stamp:
+        return copy.deepcopy(cached[1])
+
     settings = load_settings(workspace_root)
     if settings is None:
         return None
 
-    return _settings_to_config(settings, workspace_root)
+    config = _settings_to_config(settings, workspace_root)
+    _PARSE_CACHE[config_path] = (stamp, copy.deepcopy(config))
+    return config
 
 
 def save_workspace_config(config: WorkspaceConfig) -> None:
@@ -343,6 +370,8 @@ def save_workspace_config(config: WorkspaceConfig) -> None:
     doc.add("workers", workers)
 
     config_path.write_text(tomlkit.dumps(doc))
+    # A same-size rewrite within one mtime tick would otherwise hit the cache
+    _PARSE_CACHE.pop(config_path, None)
     logger.info("workspace.config.saved", path=str(config_path))
 
 
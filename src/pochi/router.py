@@ -138,7 +138,7 @@ def parse_slash_command(text: str) -> tuple[str | None, str]:
     Returns (command_name, remaining_text).
     command_name is None if text doesn't start with /.
     """
-    if not text or not text.startswith("/"):
+    if not text.startswith("/"):
         return None, text
 
     lines = text.split("\n", 1)
@@ -274,16 +274,18 @@ class ChannelRouter:
 
 
 # General topic slash commands that Python handles directly
-GENERAL_SLASH_COMMANDS = {
-    "clone",
-    "create",
-    "add",
-    "list",
-    "remove",
-    "status",
-    "help",
-    "engine",
-}
+GENERAL_SLASH_COMMANDS: frozenset[str] = frozenset(
+    {
+        "clone",
+        "create",
+        "add",
+        "list",
+        "remove",
+        "status",
+        "help",
+        "engine",
+    }
+)
 
 
 def is_general_slash_command(route: RouteResult) -> bool:
@@ -166,17 +166,12 @@ def find_workspace_root(start_path: Path | None = None) -> Path | None:
     if start_path is None:
         start_path = Path.cwd()
 
-    current = start_path.resolve()
-    while current != current.parent:
+    start = start_path.resolve()
+    # Check start and every ancestor, including the filesystem root
+    for current in (start, *start.parents):
         config_path = current / WORKSPACE_CONFIG_DIR / WORKSPACE_CONFIG_FILE
         if config_path.exists():
             return current
-        current = current.parent
-
-    # Check root as well
-    config_path = current / WORKSPACE_CONFIG_DIR / WORKSPACE_CONFIG_FILE
-    if config_path.exists():
-        return current
 
     return None
 
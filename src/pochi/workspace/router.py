@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import re
+import sys
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
@@ -20,7 +21,7 @@ logger = get_logger(__name__)
 BRANCH_DIRECTIVE_RE = re.compile(r"^@([a-zA-Z0-9][a-zA-Z0-9/_.-]*)\s*")
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RouteResult:
     """Result of routing a message."""
 
@@ -47,19 +48,17 @@ def parse_slash_command(text: str) -> tuple[str | None, str]:
     Returns (command_name, remaining_text).
     command_name is None if text doesn't start with /.
     """
-    if not text or not text.startswith("/"):
+    if not text.startswith("/"):
         return None, text
 
-    lines = text.split("\n", 1)
-    first_line = lines[0]
-    rest = lines[1] if len(lines) > 1 else ""
+    first_line, _, rest = text.partition("\n")
 
+    # Split on any whitespace so "/cmd\targs" parses like "/cmd args"
     parts = first_line.split(maxsplit=1)
-    command = parts[0][1:]  # Remove leading /
-
-    # Handle @botname suffix
-    if "@" in command:
-        command = command.split("@", 1)[0]
+    # Remove leading / and any @botname suffix
+    command, _, _bot = parts[0][1:].partition("@")
+    # Hand back the canonical string so later comparisons hit the identity check
+    command = _KNOWN_COMMANDS.get(command, command)
 
     args = parts[1] if len(parts) > 1 else ""
     if rest:
@@ -84,7 +83,8 @@ def parse_branch_directive(text: str) -> tuple[str | None, str]:
         (branch_name, remaining_text) tuple.
         branch_name is None if no directive found.
     """
-    if not text:
+    # Most messages carry no directive; skip the regex unless one could match
+    if not text or text[0] != "@":
         return None, text
 
     match = BRANCH_DIRECTIVE_RE.match(text)
@@ -116,20 +116,26 @@ class WorkspaceRouter:
 
     def __init__(self, config: "WorkspaceConfig") -> None:
         self.config = config
-        self._topic_to_folder: dict[int, "FolderConfig"] = {}
+        self._topic_to_folder: dict[int, "FolderConfig"]
         self._rebuild_topic_map()
+        self._ralph_enabled = config.ralph.enabled
 
     def _rebuild_topic_map(self) -> None:
-        """Rebuild the topic_id -> folder mapping."""
-        self._topic_to_folder.clear()
-        for folder in self.config.folders.values():
-            if folder.topic_id is not None:
-                self._topic_to_folder[folder.topic_id] = folder
+        """Rebuild the topic_id -> folder mapping.
+
+        The map is swapped in whole so route() never sees a half-built index.
+        """
+        self._topic_to_folder = {
+            folder.topic_id: folder
+            for folder in self.config.folders.values()
+            if folder.topic_id is not None
+        }
 
     def reload_config(self, config: "WorkspaceConfig") -> None:
         """Reload with updated config."""
         self.config = config
         self._rebuild_topic_map()
+        self._ralph_enabled = config.ralph.enabled
 
     def route(
         self, message_thread_id: int | None, text: str, reply_text: str | None = None
@@ -144,6 +150,18 @@ class WorkspaceRouter:
         Returns:
             RouteResult with routing information
         """
+        # General topic (message_thread_id is None or 1 for the general topic)
+        # Note: Telegram uses message_thread_id=1 for General in some cases
+        is_general = message_thread_id is None or message_thread_id == 1
+        folder = None if is_general else self._topic_to_folder.get(message_thread_id)
+        is_unbound_topic = not is_general and folder is None
+        if is_unbound_topic:
+            # Topic exists but no folder mapped
+            logger.warning(
+                "workspace.route.unbound_topic",
+                message_thread_id=message_thread_id,
+            )
+
         command, command_args = parse_slash_command(text)
         is_slash_command = command is not None
 
@@ -157,47 +175,15 @@ class WorkspaceRouter:
             if ctx and ctx.branch:
                 branch = ctx.branch
 
-        # General topic (message_thread_id is None or 1 for the general topic)
-        # Note: Telegram uses message_thread_id=1 for General in some cases
-        if message_thread_id is None or message_thread_id == 1:
-            return RouteResult(
-                is_general=True,
-                folder=None,
-                is_slash_command=is_slash_command,
-                command=command,
-                command_args=command_args,
-                branch=branch,
-                prompt_text=prompt_text,
-            )
-
-        # Specific topic - find the folder
-        folder = self._topic_to_folder.get(message_thread_id)
-
-        if folder is None:
-            # Topic exists but no folder mapped
-            logger.warning(
-                "workspace.route.unbound_topic",
-                message_thread_id=message_thread_id,
-            )
-            return RouteResult(
-                is_general=False,
-                folder=None,
-                is_slash_command=is_slash_command,
-                command=command,
-                command_args=command_args,
-                branch=branch,
-                prompt_text=prompt_text,
-                is_unbound_topic=True,
-            )
-
         return RouteResult(
-            is_general=False,
+            is_general=is_general,
             folder=folder,
             is_slash_command=is_slash_command,
             command=command,
             command_args=command_args,
             branch=branch,
             prompt_text=prompt_text,
+            is_unbound_topic=is_unbound_topic,
         )
 
     def is_ralph_command(self, route: RouteResult) -> bool:
@@ -210,31 +196,26 @@ class WorkspaceRouter:
         Returns True if:
         - Explicit /ralph-loop command, OR
         - ralph.enabled is True in config (always-on mode)
-        """
-        if route.is_general:
-            # Orchestrator never uses ralph
-            return False
-
-        if self.is_ralph_command(route):
-            return True
 
-        if self.config.ralph.enabled:
-            # Always-on ralph mode for workers
-            return True
-
-        return False
+        The orchestrator (General topic) never uses ralph.
+        """
+        return not route.is_general and (
+            self._ralph_enabled or self.is_ralph_command(route)
+        )
 
 
 # General topic slash commands that Python handles directly
-GENERAL_SLASH_COMMANDS = {
-    "clone",
-    "create",
-    "add",
-    "list",
-    "remove",
-    "status",
-    "help",
-}
+GENERAL_SLASH_COMMANDS: frozenset[str] = frozenset(
+    {
+        "clone",
+        "create",
+        "add",
+        "list",
+        "remove",
+        "status",
+        "help",
+    }
+)
 
 
 def is_general_slash_command(route: RouteResult) -> bool:
@@ -242,3 +223,10 @@ def is_general_slash_command(route: RouteResult) -> bool:
     if not route.is_general or not route.is_slash_command:
         return False
     return route.command in GENERAL_SLASH_COMMANDS
+
+
+# Interned command names returned by the slash command parser
+_KNOWN_COMMANDS: dict[str, str] = {
+    command: sys.intern(command)
+    for command in GENERAL_SLASH_COMMANDS | {"ralph", "claude"}
+}
@@ -6,7 +6,8 @@ directive to run agent sessions in isolated git worktrees.
 
 from __future__ import annotations
 
-import re
+import os
+import string
 from pathlib import Path
 
 from .logging import get_logger
@@ -26,9 +27,16 @@ logger = get_logger(__name__)
 # Default directory name for worktrees within a folder
 DEFAULT_WORKTREES_DIR = ".worktrees"
 
-# Pattern for valid branch names (git branch naming rules, simplified)
-# Allows alphanumeric, /, -, _, .
-BRANCH_NAME_RE = re.compile(r"^[a-zA-Z0-9][a-zA-Z0-9/_.-]*$")
+# Valid branch name characters (git branch naming rules, simplified):
+# must start alphanumeric, then alphanumeric, /, -, _, .
+_BRANCH_LEAD_CHARS = frozenset(string.ascii_letters + string.digits)
+# Translation table deleting every valid character; anything left is invalid
+_DROP_VALID_BRANCH_CHARS = str.maketrans(
+    "", "", string.ascii_letters + string.digits + "/_.-"
+)
+
+# Maps branch names to flat worktree directory names (feature/foo -> feature__foo)
+_WORKTREE_DIR_NAME_TABLE = str.maketrans({"/": "__"})
 
 
 class WorktreeError(Exception):
@@ -86,7 +94,7 @@ def sanitize_branch_name(name: str) -> str:
         raise ValueError("Branch name cannot be empty after sanitization")
 
     # Check for valid characters
-    if not BRANCH_NAME_RE.match(name):
+    if name[0] not in _BRANCH_LEAD_CHARS or name.translate(_DROP_VALID_BRANCH_CHARS):
         raise ValueError(f"Invalid branch name: {name}")
 
     return name
@@ -109,8 +117,27 @@ def get_worktree_path(
     """
     # Convert branch slashes to double underscores for filesystem safety
     # e.g., feature/foo -> feature__foo
-    safe_name = branch.replace("/", "__")
-    return folder_path / worktrees_dir / safe_name
+    return folder_path / worktrees_dir / branch.translate(_WORKTREE_DIR_NAME_TABLE)
+
+
+def _is_linked_worktree(worktree_path: Path, folder_path: Path) -> bool:
+    """Check for a live linked worktree of folder_path without spawning git.
+
+    A linked worktree has a .git file pointing at its admin directory under
+    the main repository's .git/worktrees/; that directory is removed when
+    the worktree is pruned. The admin directory must belong to folder_path,
+    so a worktree copied along with its repository is not mistaken for one
+    of the copy's own.
+    """
+    try:
+        content = (worktree_path / ".git").read_text()
+    except OSError:
+        return False
+    if not content.startswith("gitdir: "):
+        return False
+    admin_dir = (worktree_path / content[len("gitdir: ") :].strip()).resolve()
+    admin_root = (folder_path / ".git" / "worktrees").resolve()
+    return admin_dir.parent == admin_root and admin_dir.is_dir()
 
 
 def ensure_worktree(
@@ -145,8 +172,10 @@ def ensure_worktree(
 
     worktree_path = get_worktree_path(folder_path, branch, worktrees_dir)
 
-    # Case 1: Worktree already exists
-    if worktree_exists(worktree_path, folder_path):
+    # Case 1: Worktree already exists (stat-only check first, then ask git)
+    if _is_linked_worktree(worktree_path, folder_path) or worktree_exists(
+        worktree_path, folder_path
+    ):
         logger.info(
             "worktree.reused",
             path=str(worktree_path),
@@ -254,13 +283,12 @@ def get_active_worktrees(
     if not worktrees_path.exists():
         return []
 
-    result: list[tuple[str, Path]] = []
-    worktrees = list_worktrees(folder_path)
-
-    for wt in worktrees:
-        wt_path = wt.get("path", "")
-        branch = wt.get("branch", "")
-        if wt_path.startswith(str(worktrees_path)) and branch:
-            result.append((branch, Path(wt_path)))
-
-    return result
+    # git reports resolved paths; match on a separator-terminated prefix so a
+    # sibling like ".worktrees-old" is not mistaken for a child
+    prefix = f"{worktrees_path.resolve()}{os.sep}"
+    return [
+        (branch, Path(wt_path))
+        for wt in list_worktrees(folder_path)
+        if (wt_path := wt.get("path", "")).startswith(prefix)
+        and (branch := wt.get("branch", ""))
+    ]
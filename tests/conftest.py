@@ -1,3 +1,4 @@
+import shutil
 import sys
 from pathlib import Path
 
@@ -6,12 +7,28 @@ import structlog
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
 
+from pochi.config import clear_config_cache
+from pochi.workspace.config import (
+    WorkspaceConfig,
+    create_workspace,
+    load_workspace_config,
+)
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def anyio_backend() -> str:
+    """Run anyio tests on asyncio only, resolved once for the whole session."""
     return "asyncio"
 
 
+@pytest.fixture(autouse=True)
+def reset_config_cache():
+    """Clear the parsed workspace config cache so tests stay isolated."""
+    clear_config_cache()
+    yield
+    clear_config_cache()
+
+
 @pytest.fixture(autouse=True)
 def reset_structlog():
     """Reset structlog configuration before each test to avoid caching issues."""
@@ -19,3 +36,25 @@ def reset_structlog():
     structlog.reset_defaults()
     yield
     structlog.reset_defaults()
+
+
+@pytest.fixture(scope="session")
+def _workspace_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create the on-disk workspace template once per session."""
+    root = tmp_path_factory.mktemp("ws_template", numbered=False)
+    create_workspace(
+        root=root,
+        name="test-workspace",
+        telegram_group_id=123456,
+        bot_token="test-token",
+    )
+    return root
+
+
+@pytest.fixture
+def workspace_config(tmp_path: Path, _workspace_template: Path) -> WorkspaceConfig:
+    """Create a workspace config for testing by copying the session template."""
+    shutil.copytree(_workspace_template, tmp_path, dirs_exist_ok=True)
+    config = load_workspace_config(tmp_path)
+    assert config is not None
+    return config
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import pytest
 
 from pochi.bridge import (
     _build_bot_commands,
@@ -276,7 +275,6 @@ class TestFlattenExceptionGroup:
 class TestFormatError:
     """Tests for _format_error function."""
 
-    @pytest.mark.anyio
     async def test_single_error(self) -> None:
         from pochi.bridge import _format_error
 
@@ -284,7 +282,6 @@ class TestFormatError:
         result = _format_error(exc)
         assert result == "test error"
 
-    @pytest.mark.anyio
     async def test_empty_message_uses_class_name(self) -> None:
         from pochi.bridge import _format_error
 
@@ -292,7 +289,6 @@ class TestFormatError:
         result = _format_error(exc)
         assert result == "ValueError"
 
-    @pytest.mark.anyio
     async def test_exception_group_single_message(self) -> None:
         from pochi.bridge import _format_error
 
@@ -301,7 +297,6 @@ class TestFormatError:
         result = _format_error(group)
         assert result == "only error"
 
-    @pytest.mark.anyio
     async def test_exception_group_multiple_messages(self) -> None:
         from pochi.bridge import _format_error
 
@@ -2,7 +2,6 @@ import json
 from pathlib import Path
 
 import anyio
-import pytest
 
 from pochi.model import ActionEvent, CompletedEvent, ResumeToken, StartedEvent
 from pochi.runners.claude import (
@@ -215,7 +214,6 @@ def test_translate_thinking_block() -> None:
     assert events[0].ok is True
 
 
-@pytest.mark.anyio
 async def test_run_serializes_same_session() -> None:
     runner = ClaudeRunner(claude_cmd="claude")
     gate = anyio.Event()
@@ -252,7 +250,6 @@ async def test_run_serializes_same_session() -> None:
     assert max_in_flight == 1
 
 
-@pytest.mark.anyio
 async def test_run_serializes_new_session_after_session_is_known(
     tmp_path, monkeypatch
 ) -> None:
@@ -345,7 +342,6 @@ async def test_run_serializes_new_session_after_session_is_known(
                 await anyio.sleep(0.001)
 
 
-@pytest.mark.anyio
 async def test_run_strips_anthropic_api_key_by_default(tmp_path, monkeypatch) -> None:
     claude_path = tmp_path / "claude"
     claude_path.write_text(
@@ -5,7 +5,6 @@ from __future__ import annotations
 from pathlib import Path
 from unittest.mock import AsyncMock, patch
 
-import pytest
 
 from pochi.onboarding import (
     validate_bot_token,
@@ -18,7 +17,6 @@ from pochi.config_store import WORKSPACE_CONFIG_DIR, WORKSPACE_CONFIG_FILE
 class TestValidateBotToken:
     """Tests for validate_bot_token function."""
 
-    @pytest.mark.anyio
     async def test_returns_bot_info_on_success(self) -> None:
         """Test returns bot info when token is valid."""
         mock_bot = AsyncMock()
@@ -31,7 +29,6 @@ class TestValidateBotToken:
         assert result["username"] == "test_bot"
         mock_bot.close.assert_called_once()
 
-    @pytest.mark.anyio
     async def test_returns_none_on_error(self) -> None:
         """Test returns None when token is invalid."""
         mock_bot = AsyncMock()
@@ -47,7 +44,6 @@ class TestValidateBotToken:
 class TestValidateChatAccess:
     """Tests for validate_chat_access function."""
 
-    @pytest.mark.anyio
     async def test_returns_chat_info_on_success(self) -> None:
         """Test returns chat info when bot can access the chat."""
         mock_bot = AsyncMock()
@@ -60,7 +56,6 @@ class TestValidateChatAccess:
         assert result["title"] == "Test Group"
         mock_bot.close.assert_called_once()
 
-    @pytest.mark.anyio
     async def test_returns_none_on_error(self) -> None:
         """Test returns None when bot cannot access the chat."""
         mock_bot = AsyncMock()
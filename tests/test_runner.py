@@ -131,7 +131,6 @@ class TestSessionLockMixin:
         runner.lock_for(token)
         assert runner.session_locks is not None
 
-    @pytest.mark.anyio
     async def test_run_with_resume_lock_no_resume(self) -> None:
         """Test run_with_resume_lock without resume token."""
         runner = MockSessionLockRunner("test")
@@ -149,7 +148,6 @@ class TestSessionLockMixin:
         assert results == ["event1", "event2"]
         assert events_yielded == [("called", "test prompt", None)]
 
-    @pytest.mark.anyio
     async def test_run_with_resume_lock_with_resume(self) -> None:
         """Test run_with_resume_lock with resume token."""
         runner = MockSessionLockRunner("test")
@@ -167,7 +165,6 @@ class TestSessionLockMixin:
         assert results == ["event"]
         assert events_yielded == [("called", "test prompt", token)]
 
-    @pytest.mark.anyio
     async def test_run_with_resume_lock_wrong_engine(self) -> None:
         """Test run_with_resume_lock raises for wrong engine."""
         runner = MockSessionLockRunner("test")
@@ -180,7 +177,6 @@ class TestSessionLockMixin:
             async for _ in runner.run_with_resume_lock("prompt", wrong_token, run_fn):
                 pass
 
-    @pytest.mark.anyio
     async def test_run_with_resume_lock_serializes(self) -> None:
         """Test that run_with_resume_lock serializes calls with same token."""
         runner = MockSessionLockRunner("test")
@@ -524,7 +520,6 @@ class TestBaseRunner:
         # Should return an async iterator
         assert hasattr(result, "__anext__")
 
-    @pytest.mark.anyio
     async def test_run_locked_without_resume(self) -> None:
         """Test run_locked emits events properly."""
 
@@ -1,5 +1,4 @@
 import anyio
-import pytest
 from collections.abc import AsyncGenerator
 from typing import cast
 
@@ -18,7 +17,6 @@ from tests.factories import action_started
 CLAUDE_ENGINE = EngineId("claude")
 
 
-@pytest.mark.anyio
 async def test_runner_contract_session_started_and_order() -> None:
     raw_completed: PochiEvent = ActionEvent(
         engine=CLAUDE_ENGINE,
@@ -67,7 +65,6 @@ async def test_runner_contract_session_started_and_order() -> None:
     assert action.title == "echo ok"
 
 
-@pytest.mark.anyio
 async def test_runner_contract_resume_matches_session_started() -> None:
     runner = ScriptRunner(
         [Return(answer="ok")], engine=CLAUDE_ENGINE, resume_value="sid"
@@ -79,7 +76,6 @@ async def test_runner_contract_resume_matches_session_started() -> None:
     assert isinstance(completed.resume, ResumeToken)
 
 
-@pytest.mark.anyio
 async def test_runner_releases_lock_when_consumer_closes() -> None:
     gate = anyio.Event()
     runner = ScriptRunner([Wait(gate)], engine=CLAUDE_ENGINE, resume_value="sid")
@@ -67,7 +67,6 @@ class TestThreadScheduler:
         assert key1 == "engine-a:session-1"
         assert key2 == "engine-b:session-1"
 
-    @pytest.mark.anyio
     async def test_enqueue_and_run_single_job(self, resume_token: ResumeToken) -> None:
         """Test enqueueing and running a single job."""
         jobs_run: list[ThreadJob] = []
@@ -90,7 +89,6 @@ class TestThreadScheduler:
         assert len(jobs_run) == 1
         assert jobs_run[0] == job
 
-    @pytest.mark.anyio
     async def test_enqueue_resume_helper(self, resume_token: ResumeToken) -> None:
         """Test enqueue_resume helper method."""
         jobs_run: list[ThreadJob] = []
@@ -113,7 +111,6 @@ class TestThreadScheduler:
         assert jobs_run[0].user_msg_id == 456
         assert jobs_run[0].text == "hello"
 
-    @pytest.mark.anyio
     async def test_serializes_jobs_same_thread(self, resume_token: ResumeToken) -> None:
         """Test that jobs on the same thread run sequentially."""
         execution_order: list[int] = []
@@ -142,7 +139,6 @@ class TestThreadScheduler:
         # Jobs should run in order
         assert execution_order == [0, 1, 2]
 
-    @pytest.mark.anyio
     async def test_parallel_jobs_different_threads(self, engine_id: EngineId) -> None:
         """Test that jobs on different threads can run in parallel."""
         start_times: dict[str, float] = {}
@@ -176,7 +172,6 @@ class TestThreadScheduler:
         # The second job should start before the first one ends (parallel)
         assert start_times["thread-2"] < end_times["thread-1"]
 
-    @pytest.mark.anyio
     async def test_note_thread_known_waits_for_busy(
         self, resume_token: ResumeToken
     ) -> None:
@@ -216,7 +211,6 @@ class TestThreadScheduler:
         assert "start-waiting-job" in execution_log
         assert "end-waiting-job" in execution_log
 
-    @pytest.mark.anyio
     async def test_note_thread_known_clears_when_done(
         self, resume_token: ResumeToken
     ) -> None:
@@ -249,7 +243,6 @@ class TestThreadScheduler:
 
         assert len(jobs_run) == 1
 
-    @pytest.mark.anyio
     async def test_worker_removes_thread_when_queue_empty(
         self, resume_token: ResumeToken
     ) -> None:
@@ -278,7 +271,6 @@ class TestThreadScheduler:
 
         assert run_count == 1
 
-    @pytest.mark.anyio
     async def test_multiple_jobs_enqueued_while_running(
         self, resume_token: ResumeToken
     ) -> None:
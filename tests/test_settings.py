@@ -2,9 +2,9 @@
 
 from __future__ import annotations
 
-import os
 from pathlib import Path
 
+import pytest
 import tomlkit
 from pydantic import SecretStr
 
@@ -251,7 +251,9 @@ class TestLoadSettings:
         assert "new-folder" in settings.folders
         assert "old-repo" not in settings.folders
 
-    def test_auto_finds_workspace_root(self, tmp_path: Path) -> None:
+    def test_auto_finds_workspace_root(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test load_settings auto-finds workspace root when not provided."""
         # Create config in tmp_path
         data = {"workspace": {"name": "auto-test"}}
@@ -261,15 +263,11 @@ class TestLoadSettings:
         sub_dir = tmp_path / "subdir"
         sub_dir.mkdir()
 
-        original_cwd = os.getcwd()
-        try:
-            os.chdir(sub_dir)
-            # Now call without workspace_root - should auto-find
-            settings = load_settings()
-            assert settings is not None
-            assert settings.name == "auto-test"
-        finally:
-            os.chdir(original_cwd)
+        monkeypatch.chdir(sub_dir)
+        # Now call without workspace_root - should auto-find
+        settings = load_settings()
+        assert settings is not None
+        assert settings.name == "auto-test"
 
 
 class TestFindWorkspaceRoot:
@@ -298,6 +296,38 @@ class TestFindWorkspaceRoot:
         result = find_workspace_root(tmp_path)
         assert result is None
 
+    def test_finds_workspace_created_after_miss(self, tmp_path: Path) -> None:
+        """Test a failed lookup does not hide a workspace created later."""
+        assert find_workspace_root(tmp_path) is None
+        config_dir = tmp_path / WORKSPACE_CONFIG_DIR
+        config_dir.mkdir()
+        (config_dir / WORKSPACE_CONFIG_FILE).write_text("[workspace]\nname='test'")
+        assert find_workspace_root(tmp_path) == tmp_path
+
+    def test_root_not_found_after_config_removed(self, tmp_path: Path) -> None:
+        """Test a root is no longer found once its config file disappears."""
+        config_dir = tmp_path / WORKSPACE_CONFIG_DIR
+        config_dir.mkdir()
+        config_file = config_dir / WORKSPACE_CONFIG_FILE
+        config_file.write_text("[workspace]\nname='test'")
+        assert find_workspace_root(tmp_path) == tmp_path
+        config_file.unlink()
+        assert find_workspace_root(tmp_path) is None
+
+    def test_finds_closer_workspace_created_later(self, tmp_path: Path) -> None:
+        """Test a workspace created below an earlier found root takes over."""
+        config_dir = tmp_path / WORKSPACE_CONFIG_DIR
+        config_dir.mkdir()
+        (config_dir / WORKSPACE_CONFIG_FILE).write_text("[workspace]\nname='outer'")
+        start = tmp_path / "a" / "b" / "c"
+        start.mkdir(parents=True)
+        assert find_workspace_root(start) == tmp_path
+
+        inner_dir = tmp_path / "a" / WORKSPACE_CONFIG_DIR
+        inner_dir.mkdir()
+        (inner_dir / WORKSPACE_CONFIG_FILE).write_text("[workspace]\nname='inner'")
+        assert find_workspace_root(start) == tmp_path / "a"
+
 
 class TestEnvironmentVariables:
     """Tests for environment variable support."""
@@ -5,7 +5,6 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 from unittest.mock import MagicMock
 
-import pytest
 import anyio
 from anyio.abc import ByteReceiveStream
 
@@ -74,7 +73,6 @@ class ErrorStream(ByteReceiveStream):
         pass
 
 
-@pytest.mark.anyio
 async def test_drain_stderr_logs_lines() -> None:
     """Test drain_stderr logs each line."""
     stream = SimpleStream(b"line1\nline2\n")
@@ -86,7 +84,6 @@ async def test_drain_stderr_logs_lines() -> None:
     # Since we're mocking, we can't easily verify, but it shouldn't raise
 
 
-@pytest.mark.anyio
 async def test_drain_stderr_handles_errors() -> None:
     """Test drain_stderr handles errors gracefully."""
     stream = ErrorStream()
@@ -1,11 +1,8 @@
 import sys
 
-import pytest
-
 from pochi.utils import subprocess as subprocess_utils
 
 
-@pytest.mark.anyio
 async def test_manage_subprocess_kills_when_terminate_times_out(
     monkeypatch,
 ) -> None:
@@ -1,5 +1,11 @@
 """Tests for the Telegram client with queue-based outbox."""
 
+import io
+import json
+from collections import Counter
+from collections.abc import Callable, Iterator
+from contextlib import redirect_stdout
+
 import httpx
 import pytest
 
@@ -8,6 +14,17 @@ import anyio
 from pochi.logging import setup_logging
 from pochi.telegram import TelegramClient, TelegramRetryAfter
 
+_JSON_HEADERS = {"content-type": "application/json"}
+_OK_MESSAGE_BODY = json.dumps({"ok": True, "result": {"message_id": 1}}).encode()
+_OK_TRUE_BODY = json.dumps({"ok": True, "result": True}).encode()
+
+
+def _ok_response(
+    request: httpx.Request, body: bytes = _OK_MESSAGE_BODY
+) -> httpx.Response:
+    """Build a successful Telegram response from a pre-serialized body."""
+    return httpx.Response(200, content=body, headers=_JSON_HEADERS, request=request)
+
 
 class _FakeBot:
     """Fake bot for testing the TelegramClient outbox behavior."""
@@ -21,42 +38,13 @@ class _FakeBot:
         self.retry_after: float | None = None
         self.updates_retry_after: float | None = None
 
-    async def send_message(
-        self,
-        chat_id: int,
-        text: str,
-        reply_to_message_id: int | None = None,
-        disable_notification: bool | None = False,
-        entities: list[dict] | None = None,
-        parse_mode: str | None = None,
-        message_thread_id: int | None = None,
-        *,
-        replace_message_id: int | None = None,
-    ) -> dict:
-        _ = reply_to_message_id
-        _ = disable_notification
-        _ = entities
-        _ = parse_mode
-        _ = message_thread_id
-        _ = replace_message_id
+    async def send_message(self, chat_id: int, text: str, **_: object) -> dict:
         self.calls.append("send_message")
         return {"message_id": 1}
 
     async def edit_message_text(
-        self,
-        chat_id: int,
-        message_id: int,
-        text: str,
-        entities: list[dict] | None = None,
-        parse_mode: str | None = None,
-        *,
-        wait: bool = True,
+        self, chat_id: int, message_id: int, text: str, **_: object
     ) -> dict:
-        _ = chat_id
-        _ = message_id
-        _ = entities
-        _ = parse_mode
-        _ = wait
         self.calls.append("edit_message_text")
         self.edit_calls.append(text)
         if self.retry_after is not None and self._edit_attempts == 0:
@@ -74,27 +62,10 @@ class _FakeBot:
         self.delete_calls.append((chat_id, message_id))
         return True
 
-    async def set_my_commands(
-        self,
-        commands: list[dict],
-        *,
-        scope: dict | None = None,
-        language_code: str | None = None,
-    ) -> bool:
-        _ = commands
-        _ = scope
-        _ = language_code
+    async def set_my_commands(self, commands: list[dict], **_: object) -> bool:
         return True
 
-    async def get_updates(
-        self,
-        offset: int | None,
-        timeout_s: int = 50,
-        allowed_updates: list[str] | None = None,
-    ) -> list[dict] | None:
-        _ = offset
-        _ = timeout_s
-        _ = allowed_updates
+    async def get_updates(self, offset: int | None, **_: object) -> list[dict] | None:
         if self.updates_retry_after is not None and self._updates_attempts == 0:
             self._updates_attempts += 1
             raise TelegramRetryAfter(self.updates_retry_after)
@@ -108,7 +79,6 @@ class _FakeBot:
         return {"id": 1}
 
 
-@pytest.mark.anyio
 async def test_edits_coalesce_latest() -> None:
     """Verify that multiple edits to the same message are coalesced.
 
@@ -122,8 +92,6 @@ async def test_edits_coalesce_latest() -> None:
 
     async def handler(request: httpx.Request) -> httpx.Response:
         nonlocal first_call
-        import json
-
         data = request.read()
         params = json.loads(data)
         if "text" in params:
@@ -135,11 +103,7 @@ async def test_edits_coalesce_latest() -> None:
             first_edit_started.set()
             await release_first_edit.wait()
 
-        return httpx.Response(
-            200,
-            json={"ok": True, "result": {"message_id": 1}},
-            request=request,
-        )
+        return _ok_response(request)
 
     transport = httpx.MockTransport(handler)
     http_client = httpx.AsyncClient(transport=transport)
@@ -151,48 +115,43 @@ async def test_edits_coalesce_latest() -> None:
         group_chat_rps=0.0,
     )
 
-    try:
-        async with anyio.create_task_group() as tg:
-            # Start first edit (will block in handler)
-            tg.start_soon(client.edit_message_text, 1, 1, "first")
+    with anyio.fail_after(5):
+        try:
+            async with anyio.create_task_group() as tg:
+                # Start first edit (will block in handler)
+                tg.start_soon(client.edit_message_text, 1, 1, "first")
 
-            # Wait for the first edit to hit the handler
-            with anyio.fail_after(1):
+                # Wait for the first edit to hit the handler
                 await first_edit_started.wait()
 
-            # Now queue more edits while first is blocked
-            # These will coalesce in the outbox
-            await client.edit_message_text(1, 1, "second", wait=False)
-            await client.edit_message_text(1, 1, "third", wait=False)
+                # Now queue more edits while first is blocked
+                # These will coalesce in the outbox
+                await client.edit_message_text(1, 1, "second", wait=False)
+                await client.edit_message_text(1, 1, "third", wait=False)
 
-            # Release the first edit
-            release_first_edit.set()
+                # Release the first edit
+                release_first_edit.set()
 
-        # Wait for all processing
-        await anyio.sleep(0.1)
+            # Wait for all processing
+            await anyio.sleep(0.1)
 
-        # Should see "first" and "third" (not "second")
-        assert "first" in texts
-        assert "third" in texts
-        assert "second" not in texts  # Should be coalesced away
-    finally:
-        await client.close()
-        await http_client.aclose()
+            # Should see "first" and "third" (not "second")
+            assert "first" in texts
+            assert "third" in texts
+            assert "second" not in texts  # Should be coalesced away
+        finally:
+            await client.close()
+            await http_client.aclose()
 
 
-@pytest.mark.anyio
 async def test_send_has_higher_priority_than_edit() -> None:
     """Verify sends are processed before edits."""
-    calls: list[str] = []
+    calls: Counter[str] = Counter()
 
     def handler(request: httpx.Request) -> httpx.Response:
         method = request.url.path.split("/")[-1]
-        calls.append(method)
-        return httpx.Response(
-            200,
-            json={"ok": True, "result": {"message_id": 1}},
-            request=request,
-        )
+        calls[method] += 1
+        return _ok_response(request)
 
     transport = httpx.MockTransport(handler)
     http_client = httpx.AsyncClient(transport=transport)
@@ -224,22 +183,15 @@ async def test_send_has_higher_priority_than_edit() -> None:
         await http_client.aclose()
 
 
-@pytest.mark.anyio
 async def test_delete_drops_pending_edits() -> None:
     """Verify deleting a message drops pending edits."""
-    calls: list[str] = []
+    calls: Counter[str] = Counter()
 
     def handler(request: httpx.Request) -> httpx.Response:
         method = request.url.path.split("/")[-1]
-        calls.append(method)
-        return httpx.Response(
-            200,
-            json={
-                "ok": True,
-                "result": {"message_id": 1} if method != "deleteMessage" else True,
-            },
-            request=request,
-        )
+        calls[method] += 1
+        body = _OK_TRUE_BODY if method == "deleteMessage" else _OK_MESSAGE_BODY
+        return _ok_response(request, body)
 
     transport = httpx.MockTransport(handler)
     http_client = httpx.AsyncClient(transport=transport)
@@ -265,8 +217,8 @@ async def test_delete_drops_pending_edits() -> None:
         await client.close()
 
         # Should have first edit and delete, but NOT "progress" edit
-        edit_count = calls.count("editMessageText")
-        delete_count = calls.count("deleteMessage")
+        edit_count = calls["editMessageText"]
+        delete_count = calls["deleteMessage"]
         assert delete_count == 1
         # May have 1 or 2 edits depending on timing, but delete was called
         assert edit_count >= 1
@@ -274,15 +226,15 @@ async def test_delete_drops_pending_edits() -> None:
         await http_client.aclose()
 
 
-@pytest.mark.anyio
-async def test_telegram_429_retries() -> None:
-    """Verify that 429 responses trigger retries via the outbox."""
-    calls: list[int] = []
+def make_429_handler(
+    n_429: int, result: object
+) -> tuple[Callable[[httpx.Request], httpx.Response], Counter[str]]:
+    """Build a handler that returns 429 for the first ``n_429`` calls."""
+    calls: Counter[str] = Counter()
 
     def handler(request: httpx.Request) -> httpx.Response:
-        calls.append(1)
-        # Return 429 for first 2 calls, then success
-        if len(calls) < 3:
+        calls[request.url.path.split("/")[-1]] += 1
+        if calls.total() <= n_429:
             return httpx.Response(
                 429,
                 json={
@@ -294,77 +246,61 @@ async def test_telegram_429_retries() -> None:
             )
         return httpx.Response(
             200,
-            json={"ok": True, "result": {"message_id": 123}},
+            json={"ok": True, "result": result},
             request=request,
         )
 
+    return handler, calls
+
+
+@pytest.mark.parametrize(
+    ("method_name", "args", "expected_result", "n_429"),
+    [
+        ("send_message", (1, "hi"), {"message_id": 123}, 2),
+        ("get_updates", (None, 0), [], 1),
+    ],
+)
+async def test_telegram_429_retries(
+    method_name: str,
+    args: tuple[object, ...],
+    expected_result: object,
+    n_429: int,
+) -> None:
+    """Verify that 429 responses trigger retries via the outbox."""
+    handler, calls = make_429_handler(n_429, expected_result)
     transport = httpx.MockTransport(handler)
     http_client = httpx.AsyncClient(transport=transport)
 
-    try:
-        client = TelegramClient(
-            "123:abcDEF_ghij",
-            client=http_client,
-            private_chat_rps=0.0,
-            group_chat_rps=0.0,
-        )
-        result = await client.send_message(1, "hi")
-        await client.close()
-
-        assert result == {"message_id": 123}
-        assert len(calls) == 3  # 2 retries + 1 success
-    finally:
-        await http_client.aclose()
-
-
-@pytest.mark.anyio
-async def test_get_updates_retries_on_429() -> None:
-    """Verify get_updates retries on 429."""
-    calls: list[int] = []
-
-    def handler(request: httpx.Request) -> httpx.Response:
-        calls.append(1)
-        if len(calls) < 2:
-            return httpx.Response(
-                429,
-                json={
-                    "ok": False,
-                    "description": "retry",
-                    "parameters": {"retry_after": 0.01},
-                },
-                request=request,
+    with anyio.fail_after(5):
+        try:
+            client = TelegramClient(
+                "123:abcDEF_ghij",
+                client=http_client,
+                private_chat_rps=0.0,
+                group_chat_rps=0.0,
             )
-        return httpx.Response(
-            200,
-            json={"ok": True, "result": []},
-            request=request,
-        )
+            result = await getattr(client, method_name)(*args)
+            await client.close()
 
-    transport = httpx.MockTransport(handler)
-    http_client = httpx.AsyncClient(transport=transport)
+            assert result == expected_result
+            assert calls.total() == n_429 + 1  # retries + 1 success
+        finally:
+            await http_client.aclose()
 
-    try:
-        client = TelegramClient(
-            "123:abcDEF_ghij",
-            client=http_client,
-        )
-        with anyio.fail_after(2):
-            updates = await client.get_updates(offset=None, timeout_s=0)
-        await client.close()
 
-        assert updates == []
-        assert len(calls) == 2
-    finally:
-        await http_client.aclose()
+@pytest.fixture
+def debug_logging() -> Iterator[io.StringIO]:
+    """Enable debug logging into a buffer, restoring the default afterwards."""
+    buffer = io.StringIO()
+    with redirect_stdout(buffer):
+        setup_logging(debug=True)
+    yield buffer
+    setup_logging(debug=False)
 
 
-@pytest.mark.anyio
-async def test_no_token_in_logs_on_http_error(
-    capsys: pytest.CaptureFixture[str],
-) -> None:
+async def test_no_token_in_logs_on_http_error(debug_logging: io.StringIO) -> None:
     """Verify token is not leaked in logs."""
     token = "123:abcDEF_ghij"
-    setup_logging(debug=True)
 
     def handler(request: httpx.Request) -> httpx.Response:
         return httpx.Response(500, text="oops", request=request)
@@ -380,12 +316,11 @@ async def test_no_token_in_logs_on_http_error(
     finally:
         await http_client.aclose()
 
-    out = capsys.readouterr().out
+    out = debug_logging.getvalue()
     assert token not in out
     assert "bot[REDACTED]" in out
 
 
-@pytest.mark.anyio
 async def test_edit_with_wait_false_returns_immediately() -> None:
     """Verify non-blocking edits return None immediately."""
     calls: list[str] = []
@@ -395,37 +330,61 @@ async def test_edit_with_wait_false_returns_immediately() -> None:
         calls.append("request")
         started.set()
         await anyio.sleep(0.5)  # Slow response
-        return httpx.Response(
-            200,
-            json={"ok": True, "result": {"message_id": 1}},
-            request=request,
-        )
+        return _ok_response(request)
 
     transport = httpx.MockTransport(slow_handler)
     http_client = httpx.AsyncClient(transport=transport)
 
-    try:
-        client = TelegramClient(
-            "123:abcDEF_ghij",
-            client=http_client,
-            private_chat_rps=0.0,
-        )
+    with anyio.fail_after(5):
+        try:
+            client = TelegramClient(
+                "123:abcDEF_ghij",
+                client=http_client,
+                private_chat_rps=0.0,
+            )
 
-        # Non-blocking edit should return immediately
-        result = await client.edit_message_text(1, 1, "test", wait=False)
-        assert result is None  # Returns None immediately without waiting
+            # Non-blocking edit should return immediately
+            result = await client.edit_message_text(1, 1, "test", wait=False)
+            assert result is None  # Returns None immediately without waiting
 
-        # Wait for request to actually be made
-        with anyio.fail_after(1):
+            # Wait for request to actually be made
             await started.wait()
 
-        await client.close()
-        assert "request" in calls
-    finally:
-        await http_client.aclose()
+            await client.close()
+            assert "request" in calls
+        finally:
+            await http_client.aclose()
+
+
+async def test_close_cancels_in_flight_request() -> None:
+    """Verify close() cancels the worker instead of waiting for it to drain."""
+    started = anyio.Event()
+
+    async def hanging_handler(request: httpx.Request) -> httpx.Response:
+        started.set()
+        await anyio.sleep(60)
+        return _ok_response(request)
+
+    transport = httpx.MockTransport(hanging_handler)
+    http_client = httpx.AsyncClient(transport=transport)
+
+    with anyio.fail_after(5):
+        try:
+            client = TelegramClient(
+                "123:abcDEF_ghij",
+                client=http_client,
+                private_chat_rps=0.0,
+            )
+            await client.edit_message_text(1, 1, "test", wait=False)
+            await started.wait()
+
+            closing_at = anyio.current_time()
+            await client.close()
+            assert anyio.current_time() - closing_at < 1
+        finally:
+            await http_client.aclose()
 
 
-@pytest.mark.anyio
 async def test_interval_for_chat() -> None:
     """Verify interval calculation for different chat types."""
 
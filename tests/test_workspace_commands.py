@@ -3,24 +3,43 @@
 from __future__ import annotations
 
 from pathlib import Path
-from unittest.mock import AsyncMock, MagicMock
+from typing import Any
+from unittest.mock import MagicMock
 
 import pytest
 
-from pochi.workspace.config import FolderConfig, WorkspaceConfig, create_workspace
+from pochi.workspace.config import FolderConfig, WorkspaceConfig
 from pochi.workspace.commands import handle_slash_command
 from pochi.workspace.router import RouteResult
 
 
-@pytest.fixture
-def workspace_config(tmp_path: Path) -> WorkspaceConfig:
-    """Create a workspace config for testing."""
-    return create_workspace(
-        root=tmp_path,
-        name="test-workspace",
-        telegram_group_id=123456,
-        bot_token="test-token",
-    )
+class AsyncCapture:
+    """Lightweight async stub that records calls without AsyncMock overhead."""
+
+    def __init__(self, return_value: Any = None) -> None:
+        self.calls: list[tuple[tuple[Any, ...], dict[str, Any]]] = []
+        self.return_value = return_value
+        self.side_effect: BaseException | None = None
+
+    async def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        self.calls.append((args, kwargs))
+        if self.side_effect is not None:
+            raise self.side_effect
+        return self.return_value
+
+    @property
+    def call_args(self) -> tuple[tuple[Any, ...], dict[str, Any]]:
+        return self.calls[-1]
+
+    @property
+    def call_args_list(self) -> list[tuple[tuple[Any, ...], dict[str, Any]]]:
+        return list(self.calls)
+
+    def assert_called_once(self) -> None:
+        assert len(self.calls) == 1, f"expected 1 call, got {len(self.calls)}"
+
+    def assert_not_called(self) -> None:
+        assert not self.calls, f"expected no calls, got {len(self.calls)}"
 
 
 @pytest.fixture
@@ -28,25 +47,19 @@ def mock_manager(workspace_config: WorkspaceConfig) -> MagicMock:
     """Create a mock WorkspaceManager."""
     manager = MagicMock()
     manager.config = workspace_config
-    manager.send_to_topic = AsyncMock(return_value={"message_id": 1})
-    manager.add_folder = AsyncMock(
-        return_value=(FolderConfig(name="test", path="test", topic_id=100), 100)
+    manager.send_to_topic = AsyncCapture({"message_id": 1})
+    manager.add_folder = AsyncCapture(
+        (FolderConfig(name="test", path="test", topic_id=100), 100)
     )
     manager.bot = MagicMock()
-    manager.bot.close_forum_topic = AsyncMock(return_value=True)
+    manager.bot.close_forum_topic = AsyncCapture(True)
     return manager
 
 
-def make_route(
-    command: str,
-    args: str = "",
-    is_general: bool = True,
-    folder: FolderConfig | None = None,
-) -> RouteResult:
-    """Create a RouteResult for testing."""
+def _general_route(command: str, args: str = "") -> RouteResult:
     return RouteResult(
-        is_general=is_general,
-        folder=folder,
+        is_general=True,
+        folder=None,
         is_slash_command=True,
         command=command,
         command_args=args,
@@ -54,40 +67,64 @@ def make_route(
     )
 
 
+# Routes are never mutated by handle_slash_command, so they can be shared.
+_ROUTES: dict[tuple[str, str], RouteResult] = {
+    (command, ""): _general_route(command)
+    for command in (
+        "help",
+        "list",
+        "status",
+        "clone",
+        "create",
+        "add",
+        "remove",
+        "engine",
+        "unknown_command",
+    )
+}
+
+
+def make_route(command: str, args: str = "") -> RouteResult:
+    """Get a General-topic RouteResult for testing."""
+    cached = _ROUTES.get((command, args))
+    return cached if cached is not None else _general_route(command, args)
+
+
+def assert_reply_contains(manager: MagicMock, *needles: str) -> None:
+    """Assert a single reply was sent and that it contains every needle."""
+    manager.send_to_topic.assert_called_once()
+    text = manager.send_to_topic.call_args[0][1]  # Second positional arg is text
+    for needle in needles:
+        assert needle in text, (needle, text)
+
+
 class TestHandleSlashCommand:
     """Tests for handle_slash_command function."""
 
-    @pytest.mark.anyio
     async def test_unknown_command_does_nothing(self, mock_manager: MagicMock) -> None:
         """Test that unknown commands don't send any response."""
         route = make_route("unknown_command")
         await handle_slash_command(mock_manager, route, reply_to_message_id=1)
         mock_manager.send_to_topic.assert_not_called()
 
-    @pytest.mark.anyio
     async def test_help_command(self, mock_manager: MagicMock) -> None:
         """Test /help command shows help text."""
         route = make_route("help")
         await handle_slash_command(mock_manager, route, reply_to_message_id=1)
-        mock_manager.send_to_topic.assert_called_once()
-        call_args = mock_manager.send_to_topic.call_args
-        text = call_args[0][1]  # Second positional arg is text
-        assert "Pochi Workspace Commands" in text
-        assert "/clone" in text
-        assert "/create" in text
-        assert "/list" in text
-
-    @pytest.mark.anyio
+        assert_reply_contains(
+            mock_manager,
+            "Pochi Workspace Commands",
+            "/clone",
+            "/create",
+            "/list",
+        )
+
     async def test_list_command_empty(self, mock_manager: MagicMock) -> None:
         """Test /list command when no folders exist."""
         route = make_route("list")
         await handle_slash_command(mock_manager, route, reply_to_message_id=1)
-        mock_manager.send_to_topic.assert_called_once()
-        call_args = mock_manager.send_to_topic.call_args
-        text = call_args[0][1]
-        assert "No folders" in text
+        assert_reply_contains(mock_manager, "No folders")
 
-    @pytest.mark.anyio
     async def test_list_command_with_folders(
         self, mock_manager: MagicMock, workspace_config: WorkspaceConfig, tmp_path: Path
     ) -> None:
@@ -105,111 +142,58 @@ class TestHandleSlashCommand:
 
         route = make_route("list")
         await handle_slash_command(mock_manager, route, reply_to_message_id=1)
-        mock_manager.send_to_topic.assert_called_once()
-        call_args = mock_manager.send_to_topic.call_args
-        text = call_args[0][1]
-        assert "backend" in text
-        assert "#backend" in text
+        assert_reply_contains(mock_manager, "backend", "#backend")
 
-    @pytest.mark.anyio
     async def test_status_command(self, mock_manager: MagicMock) -> None:
         """Test /status command."""
         route = make_route("status")
         await handle_slash_command(mock_manager, route, reply_to_message_id=1)
-        mock_manager.send_to_topic.assert_called_once()
-        call_args = mock_manager.send_to_topic.call_args
-        text = call_args[0][1]
-        assert "Workspace Status" in text
-        assert "test-workspace" in text
-        assert "Folders:" in text
-        assert "Ralph Wiggum" in text
-
-    @pytest.mark.anyio
-    async def test_clone_command_no_args(self, mock_manager: MagicMock) -> None:
-        """Test /clone command without arguments shows usage."""
-        route = make_route("clone", "")
-        await handle_slash_command(mock_manager, route, reply_to_message_id=1)
-        mock_manager.send_to_topic.assert_called_once()
-        call_args = mock_manager.send_to_topic.call_args
-        text = call_args[0][1]
-        assert "Usage: /clone" in text
-
-    @pytest.mark.anyio
-    async def test_clone_command_folder_exists(
-        self, mock_manager: MagicMock, workspace_config: WorkspaceConfig
-    ) -> None:
-        """Test /clone command when folder name already exists."""
-        workspace_config.folders["existing"] = FolderConfig(
-            name="existing", path="existing"
+        assert_reply_contains(
+            mock_manager,
+            "Workspace Status",
+            "test-workspace",
+            "Folders:",
+            "Ralph Wiggum",
         )
-        route = make_route("clone", "existing git@github.com:user/repo.git")
-        await handle_slash_command(mock_manager, route, reply_to_message_id=1)
-        mock_manager.send_to_topic.assert_called_once()
-        call_args = mock_manager.send_to_topic.call_args
-        text = call_args[0][1]
-        assert "already exists" in text
-
-    @pytest.mark.anyio
-    async def test_create_command_no_args(self, mock_manager: MagicMock) -> None:
-        """Test /create command without arguments shows usage."""
-        route = make_route("create", "")
-        await handle_slash_command(mock_manager, route, reply_to_message_id=1)
-        mock_manager.send_to_topic.assert_called_once()
-        call_args = mock_manager.send_to_topic.call_args
-        text = call_args[0][1]
-        assert "Usage: /create" in text
 
-    @pytest.mark.anyio
-    async def test_create_command_folder_exists(
-        self, mock_manager: MagicMock, workspace_config: WorkspaceConfig
+    @pytest.mark.parametrize("command", ["clone", "create", "add", "remove"])
+    async def test_command_no_args_shows_usage(
+        self, mock_manager: MagicMock, command: str
     ) -> None:
-        """Test /create command when folder name already exists."""
-        workspace_config.folders["existing"] = FolderConfig(
-            name="existing", path="existing"
-        )
-        route = make_route("create", "existing")
+        """Test commands without arguments show usage."""
+        route = make_route(command, "")
         await handle_slash_command(mock_manager, route, reply_to_message_id=1)
-        mock_manager.send_to_topic.assert_called_once()
-        call_args = mock_manager.send_to_topic.call_args
-        text = call_args[0][1]
-        assert "already exists" in text
-
-    @pytest.mark.anyio
-    async def test_add_command_no_args(self, mock_manager: MagicMock) -> None:
-        """Test /add command without arguments shows usage."""
-        route = make_route("add", "")
-        await handle_slash_command(mock_manager, route, reply_to_message_id=1)
-        mock_manager.send_to_topic.assert_called_once()
-        call_args = mock_manager.send_to_topic.call_args
-        text = call_args[0][1]
-        assert "Usage: /add" in text
-
-    @pytest.mark.anyio
-    async def test_add_command_folder_exists(
-        self, mock_manager: MagicMock, workspace_config: WorkspaceConfig
+        assert_reply_contains(mock_manager, f"Usage: /{command}")
+
+    @pytest.mark.parametrize(
+        ("command", "args"),
+        [
+            ("clone", "existing git@github.com:user/repo.git"),
+            ("create", "existing"),
+            ("add", "existing /some/path"),
+        ],
+    )
+    async def test_command_folder_exists(
+        self,
+        mock_manager: MagicMock,
+        workspace_config: WorkspaceConfig,
+        command: str,
+        args: str,
     ) -> None:
-        """Test /add command when folder name already exists."""
+        """Test commands when the folder name already exists."""
         workspace_config.folders["existing"] = FolderConfig(
             name="existing", path="existing"
         )
-        route = make_route("add", "existing /some/path")
+        route = make_route(command, args)
         await handle_slash_command(mock_manager, route, reply_to_message_id=1)
-        mock_manager.send_to_topic.assert_called_once()
-        call_args = mock_manager.send_to_topic.call_args
-        text = call_args[0][1]
-        assert "already exists" in text
+        assert_reply_contains(mock_manager, "already exists")
 
-    @pytest.mark.anyio
     async def test_add_command_path_not_exists(self, mock_manager: MagicMock) -> None:
         """Test /add command when path doesn't exist."""
         route = make_route("add", "newfolder /nonexistent/path")
         await handle_slash_command(mock_manager, route, reply_to_message_id=1)
-        mock_manager.send_to_topic.assert_called_once()
-        call_args = mock_manager.send_to_topic.call_args
-        text = call_args[0][1]
-        assert "does not exist" in text
+        assert_reply_contains(mock_manager, "does not exist")
 
-    @pytest.mark.anyio
     async def test_add_command_success(
         self, mock_manager: MagicMock, tmp_path: Path
     ) -> None:
@@ -224,29 +208,14 @@ class TestHandleSlashCommand:
         # Should call add_folder
         mock_manager.add_folder.assert_called_once()
 
-    @pytest.mark.anyio
-    async def test_remove_command_no_args(self, mock_manager: MagicMock) -> None:
-        """Test /remove command without arguments shows usage."""
-        route = make_route("remove", "")
-        await handle_slash_command(mock_manager, route, reply_to_message_id=1)
-        mock_manager.send_to_topic.assert_called_once()
-        call_args = mock_manager.send_to_topic.call_args
-        text = call_args[0][1]
-        assert "Usage: /remove" in text
-
-    @pytest.mark.anyio
     async def test_remove_command_folder_not_found(
         self, mock_manager: MagicMock
     ) -> None:
         """Test /remove command when folder not found."""
         route = make_route("remove", "nonexistent")
         await handle_slash_command(mock_manager, route, reply_to_message_id=1)
-        mock_manager.send_to_topic.assert_called_once()
-        call_args = mock_manager.send_to_topic.call_args
-        text = call_args[0][1]
-        assert "not found" in text
+        assert_reply_contains(mock_manager, "not found")
 
-    @pytest.mark.anyio
     async def test_remove_command_success(
         self, mock_manager: MagicMock, workspace_config: WorkspaceConfig
     ) -> None:
@@ -260,28 +229,18 @@ class TestHandleSlashCommand:
         # Folder should be removed
         assert "todelete" not in workspace_config.folders
 
-    @pytest.mark.anyio
     async def test_engine_command_show_status(self, mock_manager: MagicMock) -> None:
         """Test /engine command without args shows status."""
         route = make_route("engine", "")
         await handle_slash_command(mock_manager, route, reply_to_message_id=1)
-        mock_manager.send_to_topic.assert_called_once()
-        call_args = mock_manager.send_to_topic.call_args
-        text = call_args[0][1]
-        assert "Engine Configuration" in text
-        assert "Default:" in text
+        assert_reply_contains(mock_manager, "Engine Configuration", "Default:")
 
-    @pytest.mark.anyio
     async def test_engine_command_unknown_engine(self, mock_manager: MagicMock) -> None:
         """Test /engine command with unknown engine."""
         route = make_route("engine", "unknown_engine_xyz")
         await handle_slash_command(mock_manager, route, reply_to_message_id=1)
-        mock_manager.send_to_topic.assert_called_once()
-        call_args = mock_manager.send_to_topic.call_args
-        text = call_args[0][1]
-        assert "Unknown engine" in text
+        assert_reply_contains(mock_manager, "Unknown engine")
 
-    @pytest.mark.anyio
     async def test_engine_command_same_engine(
         self, mock_manager: MagicMock, workspace_config: WorkspaceConfig
     ) -> None:
@@ -289,12 +248,8 @@ class TestHandleSlashCommand:
         workspace_config.default_engine = "claude"
         route = make_route("engine", "claude")
         await handle_slash_command(mock_manager, route, reply_to_message_id=1)
-        mock_manager.send_to_topic.assert_called_once()
-        call_args = mock_manager.send_to_topic.call_args
-        text = call_args[0][1]
-        assert "already the default" in text
+        assert_reply_contains(mock_manager, "already the default")
 
-    @pytest.mark.anyio
     async def test_command_error_handling(self, mock_manager: MagicMock) -> None:
         """Test that command errors are handled gracefully."""
         # Make add_folder raise an exception
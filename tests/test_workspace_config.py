@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import json
+import os
 from pathlib import Path
 
+import pytest
 import tomlkit
 
 from pochi.workspace.config import (
@@ -21,12 +24,41 @@ from pochi.workspace.config import (
 )
 
 
+def _toml_value(value: object) -> str:
+    """Render a scalar or list as a TOML value."""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, str):
+        return json.dumps(value)  # JSON strings are valid TOML basic strings
+    if isinstance(value, int | float):
+        return repr(value)
+    if isinstance(value, list):
+        return f"[{', '.join(_toml_value(item) for item in value)}]"
+    raise TypeError(f"cannot render {type(value).__name__} as a TOML value")
+
+
+def _toml_lines(table: dict, prefix: tuple[str, ...] = ()) -> list[str]:
+    """Render a dict of scalars and nested tables as TOML lines."""
+    scalars = [(k, v) for k, v in table.items() if not isinstance(v, dict)]
+    tables = [(k, v) for k, v in table.items() if isinstance(v, dict)]
+    lines: list[str] = []
+    if prefix and (scalars or not tables):
+        lines.append(f"[{'.'.join(prefix)}]")
+    lines.extend(f"{key} = {_toml_value(value)}" for key, value in scalars)
+    for key, value in tables:
+        lines.extend(_toml_lines(value, (*prefix, key)))
+    return lines
+
+
 def _write_config_from_dict(data: dict, tmp_path: Path) -> Path:
-    """Helper to write config dict to TOML file for testing."""
+    """Helper to write config dict to TOML file for testing.
+
+    Emits TOML directly so test setup never round-trips through tomlkit.
+    """
     config_dir = tmp_path / WORKSPACE_CONFIG_DIR
     config_dir.mkdir(parents=True, exist_ok=True)
     config_path = config_dir / WORKSPACE_CONFIG_FILE
-    config_path.write_text(tomlkit.dumps(data))
+    config_path.write_text("\n".join(_toml_lines(data)) + "\n")
     return config_path
 
 
@@ -54,6 +86,15 @@ class TestFolderConfig:
         repo_dir.mkdir()
         assert folder.is_git_repo(tmp_path) is False
 
+    def test_is_git_repo_sees_git_dir_added_later(self, tmp_path: Path) -> None:
+        """Test is_git_repo notices a .git directory created after a check."""
+        folder = FolderConfig(name="test-repo", path="test-repo")
+        repo_dir = tmp_path / "test-repo"
+        repo_dir.mkdir()
+        assert folder.is_git_repo(tmp_path) is False
+        (repo_dir / ".git").mkdir()
+        assert folder.is_git_repo(tmp_path) is True
+
 
 class TestRalphConfig:
     """Tests for RalphConfig dataclass."""
@@ -65,32 +106,72 @@ class TestRalphConfig:
         assert ralph.default_max_iterations == 3
 
 
+@pytest.fixture(scope="module")
+def sample_folder() -> FolderConfig:
+    """A folder bound to topic 123, shared by read-only tests."""
+    return FolderConfig(name="test", path="test", topic_id=123)
+
+
+@pytest.fixture(scope="module")
+def sample_workspace_config(
+    tmp_path_factory: pytest.TempPathFactory, sample_folder: FolderConfig
+) -> WorkspaceConfig:
+    """A workspace holding sample_folder, shared by read-only tests."""
+    return WorkspaceConfig(
+        name="test-workspace",
+        root=tmp_path_factory.mktemp("sample_workspace"),
+        telegram_group_id=1234,
+        bot_token="token",
+        folders={"test": sample_folder},
+    )
+
+
 class TestWorkspaceConfig:
     """Tests for WorkspaceConfig dataclass."""
 
-    def test_get_folder_by_topic_found(self, tmp_path: Path) -> None:
+    def test_get_folder_by_topic_found(
+        self, sample_workspace_config: WorkspaceConfig, sample_folder: FolderConfig
+    ) -> None:
         """Test get_folder_by_topic returns folder when found."""
-        folder = FolderConfig(name="test", path="test", topic_id=123)
-        config = WorkspaceConfig(
-            name="test-workspace",
-            root=tmp_path,
-            telegram_group_id=1234,
-            bot_token="token",
-            folders={"test": folder},
-        )
-        result = config.get_folder_by_topic(123)
-        assert result is folder
+        result = sample_workspace_config.get_folder_by_topic(123)
+        assert result is sample_folder
 
-    def test_get_folder_by_topic_not_found(self, tmp_path: Path) -> None:
+    def test_get_folder_by_topic_not_found(
+        self, sample_workspace_config: WorkspaceConfig
+    ) -> None:
         """Test get_folder_by_topic returns None when not found."""
+        result = sample_workspace_config.get_folder_by_topic(999)
+        assert result is None
+
+    def test_get_folder_by_topic_tracks_direct_mutation(self, tmp_path: Path) -> None:
+        """Test topic lookups follow folders added, rebound and removed."""
+        config = WorkspaceConfig(name="test-workspace", root=tmp_path)
+        assert config.get_folder_by_topic(123) is None
+
+        folder = FolderConfig(name="test", path="test", topic_id=123)
+        config.folders["test"] = folder
+        assert config.get_folder_by_topic(123) is folder
+
+        folder.topic_id = 456
+        assert config.get_folder_by_topic(123) is None
+        assert config.get_folder_by_topic(456) is folder
+
+        del config.folders["test"]
+        assert config.get_folder_by_topic(456) is None
+
+    def test_get_folder_by_topic_prefers_earlier_folder(self, tmp_path: Path) -> None:
+        """Test an earlier folder moved onto a bound topic is returned first."""
+        earlier = FolderConfig(name="b", path="b")
+        later = FolderConfig(name="a", path="a", topic_id=7)
         config = WorkspaceConfig(
             name="test-workspace",
             root=tmp_path,
-            telegram_group_id=1234,
-            bot_token="token",
+            folders={"b": earlier, "a": later},
         )
-        result = config.get_folder_by_topic(999)
-        assert result is None
+        assert config.get_folder_by_topic(7) is later
+
+        earlier.topic_id = 7
+        assert config.get_folder_by_topic(7) is earlier
 
     def test_get_pending_topics(self, tmp_path: Path) -> None:
         """Test get_pending_topics returns folders with pending_topic=True."""
@@ -109,16 +190,11 @@ class TestWorkspaceConfig:
         assert len(pending) == 1
         assert pending[0].name == "pending"
 
-    def test_config_path(self, tmp_path: Path) -> None:
+    def test_config_path(self, sample_workspace_config: WorkspaceConfig) -> None:
         """Test config_path returns correct path."""
-        config = WorkspaceConfig(
-            name="test-workspace",
-            root=tmp_path,
-            telegram_group_id=1234,
-            bot_token="token",
-        )
-        expected = tmp_path / WORKSPACE_CONFIG_DIR / WORKSPACE_CONFIG_FILE
-        assert config.config_path() == expected
+        root = sample_workspace_config.root
+        expected = root / WORKSPACE_CONFIG_DIR / WORKSPACE_CONFIG_FILE
+        assert sample_workspace_config.config_path() == expected
 
 
 class TestFindWorkspaceRoot:
@@ -182,6 +258,69 @@ default_max_iterations = 5
         assert config.ralph.enabled is True
         assert config.ralph.default_max_iterations == 5
 
+    def test_read_path_does_not_use_tomlkit(self, tmp_path: Path, monkeypatch) -> None:
+        """Test loading parses with tomllib, leaving tomlkit to the save path."""
+
+        def fail(*args: object, **kwargs: object) -> None:
+            raise AssertionError("tomlkit should not be used to read config")
+
+        monkeypatch.setattr(tomlkit, "parse", fail)
+        monkeypatch.setattr(tomlkit, "loads", fail)
+        config_dir = tmp_path / WORKSPACE_CONFIG_DIR
+        config_dir.mkdir()
+        (config_dir / WORKSPACE_CONFIG_FILE).write_text("[workspace]\nname = 'fast'\n")
+        config = load_workspace_config(tmp_path)
+        assert config is not None
+        assert config.name == "fast"
+
+    def test_repeat_loads_return_independent_copies(self, tmp_path: Path) -> None:
+        """Test cached loads never hand out a shared config object."""
+        create_workspace(
+            root=tmp_path, name="cached", telegram_group_id=1, bot_token="t"
+        )
+        first = load_workspace_config(tmp_path)
+        assert first is not None
+        first.folders["mutated"] = FolderConfig(name="mutated", path="mutated")
+        second = load_workspace_config(tmp_path)
+        assert second is not None
+        assert second is not first
+        assert "mutated" not in second.folders
+
+    def test_reload_sees_saved_changes(self, tmp_path: Path) -> None:
+        """Test the cache is invalidated when the config file changes."""
+        config = create_workspace(
+            root=tmp_path, name="before", telegram_group_id=1, bot_token="t"
+        )
+        assert load_workspace_config(tmp_path) is not None
+        config.name = "after-save"
+        save_workspace_config(config)
+        loaded = load_workspace_config(tmp_path)
+        assert loaded is not None
+        assert loaded.name == "after-save"
+
+    def test_reload_sees_same_size_save_within_one_mtime_tick(
+        self, tmp_path: Path
+    ) -> None:
+        """Test a save is visible even when mtime and size are unchanged."""
+        config = create_workspace(
+            root=tmp_path, name="ws", telegram_group_id=1, bot_token="t"
+        )
+        add_folder_to_workspace(config, "api", "api")
+        update_folder_topic_id(config, "api", 100)
+        config_path = config.config_path()
+        before = config_path.stat()
+        loaded = load_workspace_config(tmp_path)
+        assert loaded is not None
+        assert loaded.folders["api"].topic_id == 100
+
+        update_folder_topic_id(config, "api", 200)
+        # Simulate a filesystem with coarse timestamps
+        os.utime(config_path, ns=(before.st_atime_ns, before.st_mtime_ns))
+        assert config_path.stat().st_size == before.st_size
+        loaded = load_workspace_config(tmp_path)
+        assert loaded is not None
+        assert loaded.folders["api"].topic_id == 200
+
     def test_returns_none_for_missing_config(self, tmp_path: Path) -> None:
         """Test load_workspace_config returns None when config doesn't exist."""
         result = load_workspace_config(tmp_path)
@@ -197,8 +336,6 @@ default_max_iterations = 5
 
     def test_auto_finds_workspace_root(self, tmp_path: Path, monkeypatch) -> None:
         """Test load_workspace_config auto-finds workspace root when not provided."""
-        import os
-
         # Create config in tmp_path
         config_dir = tmp_path / WORKSPACE_CONFIG_DIR
         config_dir.mkdir()
@@ -210,31 +347,21 @@ default_max_iterations = 5
         sub_dir.mkdir()
 
         # Change current directory to subdirectory
-        original_cwd = os.getcwd()
-        try:
-            os.chdir(sub_dir)
-            # Now call without workspace_root - should auto-find
-            config = load_workspace_config()
-            assert config is not None
-            assert config.name == "auto-test"
-        finally:
-            os.chdir(original_cwd)
+        monkeypatch.chdir(sub_dir)
+        # Now call without workspace_root - should auto-find
+        config = load_workspace_config()
+        assert config is not None
+        assert config.name == "auto-test"
 
     def test_returns_none_when_auto_find_fails(
         self, tmp_path: Path, monkeypatch
     ) -> None:
         """Test load_workspace_config returns None when auto-find fails."""
-        import os
-
         # Change to a directory without workspace
-        original_cwd = os.getcwd()
-        try:
-            os.chdir(tmp_path)
-            # Should return None since no workspace config
-            config = load_workspace_config()
-            assert config is None
-        finally:
-            os.chdir(original_cwd)
+        monkeypatch.chdir(tmp_path)
+        # Should return None since no workspace config
+        config = load_workspace_config()
+        assert config is None
 
 
 class TestParseWorkspaceConfig:
@@ -416,6 +543,27 @@ class TestUpdateFolderTopicId:
         # Should not raise
         update_folder_topic_id(config, "nonexistent", 999)
 
+    def test_shared_topic_resolves_to_first_folder(self, tmp_path: Path) -> None:
+        """Test a topic shared by two folders keeps resolving to the first."""
+        config = create_workspace(
+            root=tmp_path,
+            name="test-workspace",
+            telegram_group_id=123,
+            bot_token="token",
+        )
+        first = add_folder_to_workspace(config, "a", "a")
+        add_folder_to_workspace(config, "b", "b")
+        update_folder_topic_id(config, "a", 5)
+        assert config.get_folder_by_topic(5) is first
+
+        update_folder_topic_id(config, "b", 5)
+        assert config.get_folder_by_topic(5) is first
+
+        config.folders["b"].topic_id = 6  # force a rebuild on the next hit
+        assert config.get_folder_by_topic(6) is config.folders["b"]
+        config.folders["b"].topic_id = 5
+        assert config.get_folder_by_topic(5) is first
+
 
 class TestTransportsConfig:
     """Tests for new [transports.<id>] config format."""
@@ -3,21 +3,36 @@
 from __future__ import annotations
 
 from pathlib import Path
-from unittest.mock import AsyncMock, MagicMock
+from typing import Any
+from unittest.mock import MagicMock
 
 import pytest
 
 from pochi.workspace.config import (
     FolderConfig,
+    TelegramConfig,
     WorkspaceConfig,
     create_workspace,
+    save_workspace_config,
 )
 from pochi.workspace.manager import WorkspaceManager
 
 
 @pytest.fixture
 def workspace_config(tmp_path: Path) -> WorkspaceConfig:
-    """Create a workspace config for testing."""
+    """Create an in-memory workspace config; nothing is written until saved."""
+    return WorkspaceConfig(
+        name="test-workspace",
+        root=tmp_path,
+        telegram=TelegramConfig(bot_token="test-token", chat_id=123456),
+        telegram_group_id=123456,
+        bot_token="test-token",
+    )
+
+
+@pytest.fixture
+def persisted_workspace_config(tmp_path: Path) -> WorkspaceConfig:
+    """Create a workspace config backed by a .pochi/workspace.toml on disk."""
     return create_workspace(
         root=tmp_path,
         name="test-workspace",
@@ -26,164 +41,182 @@ def workspace_config(tmp_path: Path) -> WorkspaceConfig:
     )
 
 
+class FakeBot:
+    """Minimal async BotClient stand-in that records calls as (method, kwargs)."""
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, dict[str, Any]]] = []
+        self._returns: dict[str, Any] = {
+            "get_chat": {"is_forum": True, "type": "supergroup"},
+            "create_forum_topic": {"message_thread_id": 100, "name": "test"},
+            "close_forum_topic": True,
+            "send_message": {"message_id": 1},
+        }
+
+    def _record(self, method: str, **kwargs: Any) -> Any:
+        self.calls.append((method, kwargs))
+        return self._returns[method]
+
+    def calls_to(self, method: str) -> list[dict[str, Any]]:
+        """Return the kwargs of every recorded call to ``method``."""
+        return [kwargs for name, kwargs in self.calls if name == method]
+
+    async def get_chat(self, chat_id: int) -> dict[str, Any] | None:
+        return self._record("get_chat", chat_id=chat_id)
+
+    async def create_forum_topic(
+        self, *, chat_id: int, name: str
+    ) -> dict[str, Any] | None:
+        return self._record("create_forum_topic", chat_id=chat_id, name=name)
+
+    async def close_forum_topic(self, *, chat_id: int, message_thread_id: int) -> bool:
+        return self._record(
+            "close_forum_topic", chat_id=chat_id, message_thread_id=message_thread_id
+        )
+
+    async def send_message(self, **kwargs: Any) -> dict[str, Any] | None:
+        return self._record("send_message", **kwargs)
+
+
 @pytest.fixture
-def mock_bot() -> MagicMock:
-    """Create a mock BotClient."""
-    bot = MagicMock()
-    bot.get_chat = AsyncMock(return_value={"is_forum": True, "type": "supergroup"})
-    bot.create_forum_topic = AsyncMock(
-        return_value={"message_thread_id": 100, "name": "test"}
-    )
-    bot.close_forum_topic = AsyncMock(return_value=True)
-    bot.send_message = AsyncMock(return_value={"message_id": 1})
-    return bot
+def bot() -> FakeBot:
+    """Create a fake BotClient."""
+    return FakeBot()
 
 
 class TestWorkspaceManager:
     """Tests for WorkspaceManager class."""
 
     def test_creates_manager(
-        self, workspace_config: WorkspaceConfig, mock_bot: MagicMock
+        self, workspace_config: WorkspaceConfig, bot: FakeBot
     ) -> None:
         """Test creating a WorkspaceManager."""
-        manager = WorkspaceManager(workspace_config, mock_bot)
+        manager = WorkspaceManager(workspace_config, bot)
         assert manager.config == workspace_config
-        assert manager.bot == mock_bot
+        assert manager.bot == bot
 
-    def test_set_router(
-        self, workspace_config: WorkspaceConfig, mock_bot: MagicMock
-    ) -> None:
+    def test_set_router(self, workspace_config: WorkspaceConfig, bot: FakeBot) -> None:
         """Test setting the router."""
-        manager = WorkspaceManager(workspace_config, mock_bot)
+        manager = WorkspaceManager(workspace_config, bot)
         mock_router = MagicMock()
         manager.set_router(mock_router)
         assert manager._workspace_router == mock_router
 
     def test_reload_router(
-        self, workspace_config: WorkspaceConfig, mock_bot: MagicMock
+        self, workspace_config: WorkspaceConfig, bot: FakeBot
     ) -> None:
         """Test _reload_router calls router.reload_config."""
-        manager = WorkspaceManager(workspace_config, mock_bot)
+        manager = WorkspaceManager(workspace_config, bot)
         mock_router = MagicMock()
         manager.set_router(mock_router)
         manager._reload_router()
         mock_router.reload_config.assert_called_once_with(workspace_config)
 
     def test_reload_router_without_router(
-        self, workspace_config: WorkspaceConfig, mock_bot: MagicMock
+        self, workspace_config: WorkspaceConfig, bot: FakeBot
     ) -> None:
         """Test _reload_router does nothing without router."""
-        manager = WorkspaceManager(workspace_config, mock_bot)
+        manager = WorkspaceManager(workspace_config, bot)
         # Should not raise
         manager._reload_router()
 
-    @pytest.mark.anyio
     async def test_check_is_forum_true(
-        self, workspace_config: WorkspaceConfig, mock_bot: MagicMock
+        self, workspace_config: WorkspaceConfig, bot: FakeBot
     ) -> None:
         """Test check_is_forum returns True for forum groups."""
-        manager = WorkspaceManager(workspace_config, mock_bot)
+        manager = WorkspaceManager(workspace_config, bot)
         result = await manager.check_is_forum()
         assert result is True
-        mock_bot.get_chat.assert_called_once_with(workspace_config.telegram_group_id)
+        assert bot.calls == [
+            ("get_chat", {"chat_id": workspace_config.telegram_group_id})
+        ]
 
-    @pytest.mark.anyio
     async def test_check_is_forum_false(
-        self, workspace_config: WorkspaceConfig, mock_bot: MagicMock
+        self, workspace_config: WorkspaceConfig, bot: FakeBot
     ) -> None:
         """Test check_is_forum returns False for non-forum groups."""
-        mock_bot.get_chat.return_value = {"is_forum": False, "type": "group"}
-        manager = WorkspaceManager(workspace_config, mock_bot)
+        bot._returns["get_chat"] = {"is_forum": False, "type": "group"}
+        manager = WorkspaceManager(workspace_config, bot)
         result = await manager.check_is_forum()
         assert result is False
 
-    @pytest.mark.anyio
     async def test_check_is_forum_error(
-        self, workspace_config: WorkspaceConfig, mock_bot: MagicMock
+        self, workspace_config: WorkspaceConfig, bot: FakeBot
     ) -> None:
         """Test check_is_forum returns False on error."""
-        mock_bot.get_chat.return_value = None
-        manager = WorkspaceManager(workspace_config, mock_bot)
+        bot._returns["get_chat"] = None
+        manager = WorkspaceManager(workspace_config, bot)
         result = await manager.check_is_forum()
         assert result is False
 
-    @pytest.mark.anyio
     async def test_create_topic_for_folder(
-        self, workspace_config: WorkspaceConfig, mock_bot: MagicMock
+        self, workspace_config: WorkspaceConfig, bot: FakeBot
     ) -> None:
         """Test create_topic_for_folder creates a topic."""
-        manager = WorkspaceManager(workspace_config, mock_bot)
+        manager = WorkspaceManager(workspace_config, bot)
         folder = FolderConfig(name="test-folder", path="test-folder")
 
         topic_id = await manager.create_topic_for_folder(folder)
 
         assert topic_id == 100
-        mock_bot.create_forum_topic.assert_called_once_with(
-            chat_id=workspace_config.telegram_group_id,
-            name="test-folder",
-        )
+        assert bot.calls_to("create_forum_topic") == [
+            {"chat_id": workspace_config.telegram_group_id, "name": "test-folder"}
+        ]
 
-    @pytest.mark.anyio
     async def test_create_topic_for_folder_failure(
-        self, workspace_config: WorkspaceConfig, mock_bot: MagicMock
+        self, workspace_config: WorkspaceConfig, bot: FakeBot
     ) -> None:
         """Test create_topic_for_folder returns None on failure."""
-        mock_bot.create_forum_topic.return_value = None
-        manager = WorkspaceManager(workspace_config, mock_bot)
+        bot._returns["create_forum_topic"] = None
+        manager = WorkspaceManager(workspace_config, bot)
         folder = FolderConfig(name="test-folder", path="test-folder")
 
         topic_id = await manager.create_topic_for_folder(folder)
 
         assert topic_id is None
 
-    @pytest.mark.anyio
     async def test_create_topic_for_folder_no_thread_id(
-        self, workspace_config: WorkspaceConfig, mock_bot: MagicMock
+        self, workspace_config: WorkspaceConfig, bot: FakeBot
     ) -> None:
         """Test create_topic_for_folder returns None when no thread_id."""
-        mock_bot.create_forum_topic.return_value = {"name": "test"}
-        manager = WorkspaceManager(workspace_config, mock_bot)
+        bot._returns["create_forum_topic"] = {"name": "test"}
+        manager = WorkspaceManager(workspace_config, bot)
         folder = FolderConfig(name="test-folder", path="test-folder")
 
         topic_id = await manager.create_topic_for_folder(folder)
 
         assert topic_id is None
 
-    @pytest.mark.anyio
     async def test_process_pending_topics(
-        self, workspace_config: WorkspaceConfig, mock_bot: MagicMock, tmp_path: Path
+        self, persisted_workspace_config: WorkspaceConfig, bot: FakeBot
     ) -> None:
         """Test process_pending_topics creates topics for pending folders."""
         # Add a pending folder
-        workspace_config.folders["pending"] = FolderConfig(
+        persisted_workspace_config.folders["pending"] = FolderConfig(
             name="pending", path="pending", pending_topic=True
         )
         # Save the config so reload works
-        from pochi.workspace.config import save_workspace_config
-
-        save_workspace_config(workspace_config)
+        save_workspace_config(persisted_workspace_config)
 
-        manager = WorkspaceManager(workspace_config, mock_bot)
+        manager = WorkspaceManager(persisted_workspace_config, bot)
         created = await manager.process_pending_topics()
 
         assert len(created) == 1
         assert created[0] == ("pending", 100)
 
-    @pytest.mark.anyio
     async def test_process_pending_topics_empty(
-        self, workspace_config: WorkspaceConfig, mock_bot: MagicMock
+        self, workspace_config: WorkspaceConfig, bot: FakeBot
     ) -> None:
         """Test process_pending_topics with no pending topics."""
-        manager = WorkspaceManager(workspace_config, mock_bot)
+        manager = WorkspaceManager(workspace_config, bot)
         created = await manager.process_pending_topics()
         assert created == []
 
-    @pytest.mark.anyio
     async def test_add_folder(
-        self, workspace_config: WorkspaceConfig, mock_bot: MagicMock
+        self, workspace_config: WorkspaceConfig, bot: FakeBot
     ) -> None:
         """Test add_folder adds a folder and creates topic."""
-        manager = WorkspaceManager(workspace_config, mock_bot)
+        manager = WorkspaceManager(workspace_config, bot)
 
         folder, topic_id = await manager.add_folder(
             name="new-folder",
@@ -198,12 +231,11 @@ class TestWorkspaceManager:
         assert folder.origin == "git@github.com:user/repo.git"
         assert topic_id == 100
 
-    @pytest.mark.anyio
     async def test_add_folder_no_topic(
-        self, workspace_config: WorkspaceConfig, mock_bot: MagicMock
+        self, workspace_config: WorkspaceConfig, bot: FakeBot
     ) -> None:
         """Test add_folder without creating topic."""
-        manager = WorkspaceManager(workspace_config, mock_bot)
+        manager = WorkspaceManager(workspace_config, bot)
 
         folder, topic_id = await manager.add_folder(
             name="new-folder",
@@ -213,14 +245,13 @@ class TestWorkspaceManager:
 
         assert folder.name == "new-folder"
         assert topic_id is None
-        mock_bot.create_forum_topic.assert_not_called()
+        assert bot.calls_to("create_forum_topic") == []
 
-    @pytest.mark.anyio
     async def test_send_to_topic(
-        self, workspace_config: WorkspaceConfig, mock_bot: MagicMock
+        self, workspace_config: WorkspaceConfig, bot: FakeBot
     ) -> None:
         """Test send_to_topic sends a message."""
-        manager = WorkspaceManager(workspace_config, mock_bot)
+        manager = WorkspaceManager(workspace_config, bot)
 
         result = await manager.send_to_topic(
             topic_id=100,
@@ -229,38 +260,39 @@ class TestWorkspaceManager:
         )
 
         assert result == {"message_id": 1}
-        mock_bot.send_message.assert_called_once_with(
-            chat_id=workspace_config.telegram_group_id,
-            text="Hello world",
-            message_thread_id=100,
-            reply_to_message_id=1,
-            disable_notification=False,
-            parse_mode=None,
-        )
+        assert bot.calls == [
+            (
+                "send_message",
+                {
+                    "chat_id": workspace_config.telegram_group_id,
+                    "text": "Hello world",
+                    "message_thread_id": 100,
+                    "reply_to_message_id": 1,
+                    "disable_notification": False,
+                    "parse_mode": None,
+                },
+            )
+        ]
 
-    @pytest.mark.anyio
     async def test_send_to_general_topic(
-        self, workspace_config: WorkspaceConfig, mock_bot: MagicMock
+        self, workspace_config: WorkspaceConfig, bot: FakeBot
     ) -> None:
         """Test send_to_topic with None topic_id sends to General."""
-        manager = WorkspaceManager(workspace_config, mock_bot)
+        manager = WorkspaceManager(workspace_config, bot)
 
         await manager.send_to_topic(None, "Hello General")
 
-        mock_bot.send_message.assert_called_once()
-        call_kwargs = mock_bot.send_message.call_args[1]
+        (call_kwargs,) = bot.calls_to("send_message")
         assert call_kwargs["message_thread_id"] is None
 
-    @pytest.mark.anyio
     async def test_send_unbound_topic_error(
-        self, workspace_config: WorkspaceConfig, mock_bot: MagicMock
+        self, workspace_config: WorkspaceConfig, bot: FakeBot
     ) -> None:
         """Test send_unbound_topic_error sends error message."""
-        manager = WorkspaceManager(workspace_config, mock_bot)
+        manager = WorkspaceManager(workspace_config, bot)
 
         await manager.send_unbound_topic_error(topic_id=100, reply_to_message_id=1)
 
-        mock_bot.send_message.assert_called_once()
-        call_args = mock_bot.send_message.call_args
-        text = call_args[1]["text"]
+        (call_kwargs,) = bot.calls_to("send_message")
+        text = call_kwargs["text"]
         assert "not bound to a folder" in text
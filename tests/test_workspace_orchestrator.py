@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import pytest
 
 from pochi.workspace.config import FolderConfig, WorkspaceConfig
 from pochi.workspace.orchestrator import (
@@ -12,145 +13,157 @@ from pochi.workspace.orchestrator import (
 )
 
 
+@pytest.fixture(scope="module")
+def _basic_config(tmp_path_factory: pytest.TempPathFactory) -> WorkspaceConfig:
+    """An empty workspace config shared by read-only tests."""
+    return WorkspaceConfig(
+        name="test-workspace",
+        root=tmp_path_factory.mktemp("ws"),
+        telegram_group_id=123,
+        bot_token="token",
+    )
+
+
+@pytest.fixture(scope="module")
+def _basic_context(_basic_config: WorkspaceConfig) -> str:
+    """Orchestrator context for the empty workspace, rendered once."""
+    return build_orchestrator_context(_basic_config)
+
+
+@pytest.fixture(scope="module")
+def _folders_context(tmp_path_factory: pytest.TempPathFactory) -> str:
+    """Orchestrator context for a workspace with a git and a plain folder."""
+    root = tmp_path_factory.mktemp("ws_folders")
+    # Create a folder that looks like a git repo
+    repo_dir = root / "backend"
+    repo_dir.mkdir()
+    (repo_dir / ".git").mkdir()
+
+    folders = {
+        "backend": FolderConfig(
+            name="backend",
+            path="backend",
+            topic_id=100,
+            description="API server",
+            origin="git@github.com:user/backend.git",
+        ),
+        "frontend": FolderConfig(
+            name="frontend",
+            path="frontend",
+            topic_id=200,
+        ),
+    }
+    config = WorkspaceConfig(
+        name="test-workspace",
+        root=root,
+        telegram_group_id=123,
+        bot_token="token",
+        folders=folders,
+    )
+    return build_orchestrator_context(config)
+
+
+@pytest.fixture(scope="module")
+def _no_topic_context(tmp_path_factory: pytest.TempPathFactory) -> str:
+    """Orchestrator context for a workspace whose only folder has no topic."""
+    folders = {
+        "pending": FolderConfig(
+            name="pending",
+            path="pending",
+            pending_topic=True,
+        ),
+    }
+    config = WorkspaceConfig(
+        name="test-workspace",
+        root=tmp_path_factory.mktemp("ws_no_topic"),
+        telegram_group_id=123,
+        bot_token="token",
+        folders=folders,
+    )
+    return build_orchestrator_context(config)
+
+
 class TestBuildOrchestratorContext:
     """Tests for build_orchestrator_context function."""
 
-    def test_basic_context_structure(self, tmp_path: Path) -> None:
+    def test_basic_context_structure(
+        self, _basic_config: WorkspaceConfig, _basic_context: str
+    ) -> None:
         """Test basic context structure is generated correctly."""
-        config = WorkspaceConfig(
-            name="test-workspace",
-            root=tmp_path,
-            telegram_group_id=123,
-            bot_token="token",
-        )
-        context = build_orchestrator_context(config)
+        assert "# Pochi Workspace Context" in _basic_context
+        assert "test-workspace" in _basic_context
+        assert str(_basic_config.root) in _basic_context
+        assert "No folders in this workspace yet." in _basic_context
 
-        assert "# Pochi Workspace Context" in context
-        assert "test-workspace" in context
-        assert str(tmp_path) in context
-        assert "No folders in this workspace yet." in context
-
-    def test_context_with_folders(self, tmp_path: Path) -> None:
+    def test_context_with_folders(self, _folders_context: str) -> None:
         """Test context includes folder information."""
-        # Create a folder that looks like a git repo
-        repo_dir = tmp_path / "backend"
-        repo_dir.mkdir()
-        (repo_dir / ".git").mkdir()
-
-        folders = {
-            "backend": FolderConfig(
-                name="backend",
-                path="backend",
-                topic_id=100,
-                description="API server",
-                origin="git@github.com:user/backend.git",
-            ),
-            "frontend": FolderConfig(
-                name="frontend",
-                path="frontend",
-                topic_id=200,
-            ),
-        }
-        config = WorkspaceConfig(
-            name="test-workspace",
-            root=tmp_path,
-            telegram_group_id=123,
-            bot_token="token",
-            folders=folders,
-        )
-        context = build_orchestrator_context(config)
-
-        assert "## Folders" in context
-        assert "**backend**" in context
-        assert "(git)" in context
-        assert "topic #100" in context
-        assert "API server" in context
-        assert "git@github.com:user/backend.git" in context
-        assert "**frontend**" in context
-        assert "topic #200" in context
-
-    def test_context_with_folder_no_topic(self, tmp_path: Path) -> None:
+        assert "## Folders" in _folders_context
+        assert "**backend**" in _folders_context
+        assert "(git)" in _folders_context
+        assert "topic #100" in _folders_context
+        assert "API server" in _folders_context
+        assert "git@github.com:user/backend.git" in _folders_context
+        assert "**frontend**" in _folders_context
+        assert "topic #200" in _folders_context
+
+    def test_context_with_folder_no_topic(self, _no_topic_context: str) -> None:
         """Test context shows 'no topic' for folders without topic_id."""
-        folders = {
-            "pending": FolderConfig(
-                name="pending",
-                path="pending",
-                pending_topic=True,
-            ),
-        }
-        config = WorkspaceConfig(
-            name="test-workspace",
-            root=tmp_path,
-            telegram_group_id=123,
-            bot_token="token",
-            folders=folders,
-        )
-        context = build_orchestrator_context(config)
-
-        assert "no topic" in context
+        assert "no topic" in _no_topic_context
 
-    def test_context_includes_capabilities(self, tmp_path: Path) -> None:
+    def test_context_includes_capabilities(self, _basic_context: str) -> None:
         """Test context includes capabilities section."""
-        config = WorkspaceConfig(
-            name="test-workspace",
-            root=tmp_path,
-            telegram_group_id=123,
-            bot_token="token",
-        )
-        context = build_orchestrator_context(config)
+        assert "## Your Capabilities" in _basic_context
+        assert "orchestrator" in _basic_context
+        assert "git clone" in _basic_context
+        assert "gh" in _basic_context
 
-        assert "## Your Capabilities" in context
-        assert "orchestrator" in context
-        assert "git clone" in context
-        assert "gh" in context
-
-    def test_context_includes_slash_commands(self, tmp_path: Path) -> None:
+    def test_context_includes_slash_commands(self, _basic_context: str) -> None:
         """Test context includes slash commands documentation."""
+        assert "## Available Slash Commands" in _basic_context
+        assert "/clone" in _basic_context
+        assert "/create" in _basic_context
+        assert "/add" in _basic_context
+        assert "/list" in _basic_context
+        assert "/remove" in _basic_context
+        assert "/status" in _basic_context
+        assert "/help" in _basic_context
+
+    def test_context_reflects_config_changes(self, tmp_path: Path) -> None:
+        """Test the context follows folders added and git-initialised later."""
         config = WorkspaceConfig(
             name="test-workspace",
             root=tmp_path,
             telegram_group_id=123,
             bot_token="token",
         )
+        assert "No folders" in build_orchestrator_context(config)
+
+        config.folders["api"] = FolderConfig(name="api", path="api", topic_id=300)
+        (tmp_path / "api").mkdir()
         context = build_orchestrator_context(config)
+        assert "**api**  (topic #300)" in context
 
-        assert "## Available Slash Commands" in context
-        assert "/clone" in context
-        assert "/create" in context
-        assert "/add" in context
-        assert "/list" in context
-        assert "/remove" in context
-        assert "/status" in context
-        assert "/help" in context
+        (tmp_path / "api" / ".git").mkdir()
+        assert "**api** (git) (topic #300)" in build_orchestrator_context(config)
 
 
 class TestPrependOrchestratorContext:
     """Tests for prepend_orchestrator_context function."""
 
-    def test_prepends_context_to_message(self, tmp_path: Path) -> None:
+    def test_prepends_context_to_message(self, _basic_config: WorkspaceConfig) -> None:
         """Test that context is prepended to user message."""
-        config = WorkspaceConfig(
-            name="test-workspace",
-            root=tmp_path,
-            telegram_group_id=123,
-            bot_token="token",
-        )
         user_message = "Hello, I need help!"
-        result = prepend_orchestrator_context(config, user_message)
+        result = prepend_orchestrator_context(_basic_config, user_message)
 
         assert result.startswith("# Pochi Workspace Context")
         assert "---" in result
         assert result.endswith("Hello, I need help!")
 
-    def test_separator_between_context_and_message(self, tmp_path: Path) -> None:
+    def test_separator_between_context_and_message(
+        self, _basic_config: WorkspaceConfig
+    ) -> None:
         """Test that separator exists between context and message."""
-        config = WorkspaceConfig(
-            name="test-workspace",
-            root=tmp_path,
-            telegram_group_id=123,
-            bot_token="token",
-        )
-        result = prepend_orchestrator_context(config, "Test message")
+        result = prepend_orchestrator_context(_basic_config, "Test message")
 
         # Context should be separated by "---"
         parts = result.split("---")
@@ -158,15 +171,9 @@ class TestPrependOrchestratorContext:
         assert "Pochi Workspace Context" in parts[0]
         assert "Test message" in parts[1]
 
-    def test_preserves_multiline_message(self, tmp_path: Path) -> None:
+    def test_preserves_multiline_message(self, _basic_config: WorkspaceConfig) -> None:
         """Test that multiline user messages are preserved."""
-        config = WorkspaceConfig(
-            name="test-workspace",
-            root=tmp_path,
-            telegram_group_id=123,
-            bot_token="token",
-        )
         user_message = "Line 1\nLine 2\nLine 3"
-        result = prepend_orchestrator_context(config, user_message)
+        result = prepend_orchestrator_context(_basic_config, user_message)
 
         assert "Line 1\nLine 2\nLine 3" in result
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import shutil
 import subprocess
 from pathlib import Path
 
@@ -17,6 +18,60 @@ from pochi.worktrees import (
 )
 
 
+@pytest.fixture(scope="module")
+def _git_repo_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create a minimal git repository once per module for tests to copy."""
+    repo_path = tmp_path_factory.mktemp("git_template") / "test-repo"
+    repo_path.mkdir()
+
+    # Initialize git repo
+    subprocess.run(
+        ["git", "init"],
+        cwd=repo_path,
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+    # Create initial commit, passing the test identity inline
+    (repo_path / "README.md").write_text("# Test\n")
+    subprocess.run(
+        ["git", "add", "."],
+        cwd=repo_path,
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    subprocess.run(
+        [
+            "git",
+            "-c",
+            "user.email=test@test.com",
+            "-c",
+            "user.name=Test User",
+            "commit",
+            "-m",
+            "Initial commit",
+        ],
+        cwd=repo_path,
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+    return repo_path
+
+
+@pytest.fixture
+def git_repo(tmp_path: Path, _git_repo_template: Path) -> Path:
+    """Create a private copy of the template git repository for one test.
+
+    The template has no worktrees, so it holds no absolute paths and copies
+    cleanly; tests create worktrees in their own copy.
+    """
+    return shutil.copytree(_git_repo_template, tmp_path / "test-repo", symlinks=True)
+
+
 class TestSanitizeBranchName:
     """Tests for sanitize_branch_name function."""
 
@@ -75,6 +130,11 @@ class TestSanitizeBranchName:
         with pytest.raises(ValueError, match="Invalid branch name"):
             sanitize_branch_name("foo$bar")
 
+    def test_invalid_leading_character_raises(self) -> None:
+        """Test that a name must start with an alphanumeric character."""
+        with pytest.raises(ValueError, match="Invalid branch name"):
+            sanitize_branch_name("-foo")
+
     def test_name_with_underscore(self) -> None:
         """Test that underscores are allowed."""
         assert sanitize_branch_name("feature_foo") == "feature_foo"
@@ -118,43 +178,6 @@ class TestGetWorktreePath:
 class TestEnsureWorktree:
     """Tests for ensure_worktree function."""
 
-    @pytest.fixture
-    def git_repo(self, tmp_path: Path) -> Path:
-        """Create a minimal git repository for testing."""
-        repo_path = tmp_path / "test-repo"
-        repo_path.mkdir()
-
-        # Initialize git repo
-        subprocess.run(
-            ["git", "init"],
-            cwd=repo_path,
-            capture_output=True,
-            check=True,
-        )
-
-        # Configure git user
-        subprocess.run(
-            ["git", "config", "user.email", "test@test.com"],
-            cwd=repo_path,
-            check=True,
-        )
-        subprocess.run(
-            ["git", "config", "user.name", "Test User"],
-            cwd=repo_path,
-            check=True,
-        )
-
-        # Create initial commit
-        (repo_path / "README.md").write_text("# Test\n")
-        subprocess.run(["git", "add", "."], cwd=repo_path, check=True)
-        subprocess.run(
-            ["git", "commit", "-m", "Initial commit"],
-            cwd=repo_path,
-            check=True,
-        )
-
-        return repo_path
-
     def test_raises_if_not_git_repo(self, tmp_path: Path) -> None:
         """Test that non-git directory raises WorktreeError."""
         non_repo = tmp_path / "not-a-repo"
@@ -163,6 +186,18 @@ class TestEnsureWorktree:
         with pytest.raises(WorktreeError, match="Not a git repository"):
             ensure_worktree(non_repo, "feature-foo")
 
+    def test_repo_check_does_not_spawn_git(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test the git repository check is a stat, not a git subprocess."""
+
+        def fail(*args: object, **kwargs: object) -> None:
+            raise AssertionError("repository check should not run git")
+
+        monkeypatch.setattr("pochi.utils.git.subprocess.run", fail)
+        with pytest.raises(WorktreeError, match="Not a git repository"):
+            ensure_worktree(tmp_path, "feature-foo")
+
     def test_creates_new_branch_worktree(self, git_repo: Path) -> None:
         """Test creating worktree for new branch."""
         result = ensure_worktree(git_repo, "feature-new")
@@ -186,6 +221,45 @@ class TestEnsureWorktree:
         assert result2 == result1
         assert marker.exists()
 
+    def test_reuse_does_not_query_git(
+        self, git_repo: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that reusing a linked worktree is decided without spawning git."""
+        result1 = ensure_worktree(git_repo, "feature-fast")
+
+        def fail(*args: object, **kwargs: object) -> None:
+            raise AssertionError("git should not be consulted on reuse")
+
+        monkeypatch.setattr("pochi.worktrees.worktree_exists", fail)
+        assert ensure_worktree(git_repo, "feature-fast") == result1
+
+    def test_rejects_worktree_of_copied_repo(
+        self, git_repo: Path, tmp_path: Path
+    ) -> None:
+        """Test a worktree copied with its repo is not reused by the copy."""
+        ensure_worktree(git_repo, "feature-copied")
+        copy = shutil.copytree(git_repo, tmp_path / "copy", symlinks=True)
+
+        # The copied worktree still points at the original repository
+        with pytest.raises(WorktreeError):
+            ensure_worktree(copy, "feature-copied")
+
+    def test_recreates_removed_worktree(self, git_repo: Path) -> None:
+        """Test that a worktree removed via git is recreated, not reused."""
+        result1 = ensure_worktree(git_repo, "feature-removed")
+        subprocess.run(
+            ["git", "worktree", "remove", "--force", str(result1)],
+            cwd=git_repo,
+            check=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        assert not result1.exists()
+
+        result2 = ensure_worktree(git_repo, "feature-removed")
+        assert result2 == result1
+        assert (result2 / "README.md").exists()
+
     def test_creates_worktree_for_existing_branch(self, git_repo: Path) -> None:
         """Test creating worktree for existing local branch."""
         # Create branch first
@@ -193,6 +267,8 @@ class TestEnsureWorktree:
             ["git", "branch", "existing-branch"],
             cwd=git_repo,
             check=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
         )
 
         result = ensure_worktree(git_repo, "existing-branch")
@@ -220,57 +296,15 @@ class TestGetActiveWorktrees:
     """Tests for get_active_worktrees function."""
 
     @pytest.fixture
-    def git_repo_with_worktrees(self, tmp_path: Path) -> Path:
+    def git_repo_with_worktrees(self, git_repo: Path) -> Path:
         """Create a git repo with some worktrees."""
-        repo_path = tmp_path / "test-repo"
-        repo_path.mkdir()
-
-        # Initialize git repo
-        subprocess.run(["git", "init"], cwd=repo_path, check=True)
-        subprocess.run(
-            ["git", "config", "user.email", "test@test.com"],
-            cwd=repo_path,
-            check=True,
-        )
-        subprocess.run(
-            ["git", "config", "user.name", "Test User"],
-            cwd=repo_path,
-            check=True,
-        )
-        (repo_path / "README.md").write_text("# Test\n")
-        subprocess.run(["git", "add", "."], cwd=repo_path, check=True)
-        subprocess.run(
-            ["git", "commit", "-m", "Initial commit"], cwd=repo_path, check=True
-        )
-
-        # Create worktrees
-        ensure_worktree(repo_path, "feature-one")
-        ensure_worktree(repo_path, "feature-two")
+        ensure_worktree(git_repo, "feature-one")
+        ensure_worktree(git_repo, "feature-two")
+        return git_repo
 
-        return repo_path
-
-    def test_returns_empty_for_no_worktrees(self, tmp_path: Path) -> None:
+    def test_returns_empty_for_no_worktrees(self, git_repo: Path) -> None:
         """Test returns empty list when no worktrees exist."""
-        repo_path = tmp_path / "empty-repo"
-        repo_path.mkdir()
-        subprocess.run(["git", "init"], cwd=repo_path, check=True)
-        subprocess.run(
-            ["git", "config", "user.email", "test@test.com"],
-            cwd=repo_path,
-            check=True,
-        )
-        subprocess.run(
-            ["git", "config", "user.name", "Test User"],
-            cwd=repo_path,
-            check=True,
-        )
-        (repo_path / "README.md").write_text("# Test\n")
-        subprocess.run(["git", "add", "."], cwd=repo_path, check=True)
-        subprocess.run(
-            ["git", "commit", "-m", "Initial commit"], cwd=repo_path, check=True
-        )
-
-        result = get_active_worktrees(repo_path)
+        result = get_active_worktrees(git_repo)
         assert result == []
 
     def test_returns_active_worktrees(self, git_repo_with_worktrees: Path) -> None:
@@ -281,3 +315,21 @@ class TestGetActiveWorktrees:
         branches = [branch for branch, _ in result]
         assert "feature-one" in branches
         assert "feature-two" in branches
+
+    def test_ignores_worktrees_in_sibling_directory(
+        self, git_repo_with_worktrees: Path
+    ) -> None:
+        """Test worktrees under a similarly named sibling dir are not included."""
+        sibling = git_repo_with_worktrees / f"{DEFAULT_WORKTREES_DIR}-old" / "stale"
+        subprocess.run(
+            ["git", "worktree", "add", "-b", "stale", str(sibling)],
+            cwd=git_repo_with_worktrees,
+            check=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+
+        branches = [
+            branch for branch, _ in get_active_worktrees(git_repo_with_worktrees)
+        ]
+        assert sorted(branches) == ["feature-one", "feature-two"]